@@ -6,32 +6,353 @@ Designed for scheduled execution via Cloud Scheduler or external workflows.
 """
 
 import os
-import json
+import io
+import csv
+import gzip
+import hashlib
 import logging
-from flask import Flask, request, jsonify
-from threading import Thread
-import traceback
-import pandas as pd
+from types import MappingProxyType
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import orjson
+import msgpack
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from zocdoc_scraper_production import CFG, ZocDocScraper, appointments_table, setup_logging
+
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster response serialization."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-from zocdoc_scraper_production import ZocDocScraper, setup_logging
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Rows rendered per chunk when streaming CSV exports
+CSV_CHUNK_SIZE = 1000
 
-# Global state for tracking scraper execution
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# gzip level for compressed JSON/MessagePack bodies
+GZIP_LEVEL = 6
+
+# Negotiated response bodies depend on these request headers
+VARY_HEADERS = 'Accept, Accept-Encoding'
+
+# On-disk columnar stores, one file per run named after its payload ETag, so a
+# reader holding an older snapshot keeps reading that run's file
+APPOINTMENTS_STORE_DIR = CFG.output_dir
+APPOINTMENTS_STORE_GLOB = 'appointments_store_*.parquet'
+PARQUET_ROW_GROUP_SIZE = 10000
+
+# Single-slot executor: at most one scraper run at a time
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scraper')
+_trigger_lock = Lock()
+_scraper_future = None
+
+# Global state for tracking scraper execution. Run outputs live in an
+# immutable snapshot that is swapped whole, so readers never see a mix of
+# two runs and need no lock.
+_status_lock = Lock()
+_msgpack_lock = Lock()  # Serializes first-use MessagePack rendering in cached_msgpack
 scraper_status = {
-    'running': False,
     'last_run': None,
-    'last_result': None,
-    'appointments': []  # Store actual appointment data
+    'snapshot': MappingProxyType({
+        'last_result': None,
+        'appointments': None,  # Path to the Parquet store holding the latest appointments
+        'appointments_cache': None,  # Serialized appointment payload, rebuilt per run
+        'results_etag': None
+    })
 }
-def run_scraper_async():
-    """Run scraper in background thread."""
-    global scraper_status
+
+
+def publish_snapshot(**updates):
+    """
+    Replace the published status snapshot with an updated copy.
+    
+    Args:
+        **updates: Snapshot keys to overwrite
+    """
+    with _status_lock:
+        snapshot = dict(scraper_status['snapshot'])
+        snapshot.update(updates)
+        
+        # /results covers both the run summary and the appointments payload
+        cache = snapshot['appointments_cache']
+        snapshot['results_etag'] = payload_etag(
+            orjson.dumps(snapshot['last_result'], default=str),
+            cache['etag'].encode() if cache else b''
+        )
+        
+        scraper_status['snapshot'] = MappingProxyType(snapshot)
+
+
+def payload_etag(*parts):
+    """
+    Compute a strong ETag over serialized payload bytes.
+    
+    Args:
+        *parts: Byte strings making up the payload
+    
+    Returns:
+        Hex digest usable as an ETag value
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def appointments_store_path(etag):
+    """Return the Parquet store path for the run whose payload has this ETag."""
+    return APPOINTMENTS_STORE_DIR / f'appointments_store_{etag}.parquet'
+
+
+def write_appointments_store(appointments, path):
+    """
+    Write appointments to a Parquet store in fixed-size row groups.
+    
+    The file is written next to its destination and moved into place
+    atomically, so readers never observe a partially written store.
+    
+    Args:
+        appointments: List of appointment dictionaries
+        path: Destination Parquet file, from appointments_store_path
+    
+    Returns:
+        Path to the written store
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    writer = None
+    
+    try:
+        for start in range(0, len(appointments), PARQUET_ROW_GROUP_SIZE):
+            table = pa.Table.from_pylist(
+                appointments[start:start + PARQUET_ROW_GROUP_SIZE],
+                schema=writer.schema if writer else None
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+        
+        # No rows: still write a store with the appointment columns
+        if writer is None:
+            pq.write_table(appointments_table([]), tmp_path)
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    os.replace(tmp_path, path)
+    return path
+
+
+def prune_appointments_stores(keep):
+    """
+    Delete run stores no published or just-replaced snapshot refers to.
+    
+    The store of the previous snapshot is kept, since a request that read
+    that snapshot may not have opened its file yet.
+    
+    Args:
+        keep: Store paths to leave in place
+    """
+    for path in APPOINTMENTS_STORE_DIR.glob(APPOINTMENTS_STORE_GLOB):
+        if path not in keep:
+            path.unlink(missing_ok=True)
+
+
+def build_appointments_cache(appointments, last_result):
+    """
+    Serialize the appointments payloads served by /appointments and /results.
+    
+    The data only changes once per scraper run, so the JSON body, plain
+    and gzipped, is rendered here once instead of on every request. The
+    bare appointments JSON array is kept as well so /results can splice
+    it in without re-encoding. MessagePack bodies are rendered on first
+    request by cached_msgpack.
+    
+    Args:
+        appointments: List of appointment dictionaries
+        last_result: Run summary returned by ZocDocScraper.run
+    
+    Returns:
+        Dictionary with pre-serialized 'json' bytes, its gzipped 'json_gz'
+        variant, the 'fragment' array, the 'last_result' summary, the
+        appointment 'count' and the payload 'etag'
+    """
+    fragment = orjson.Fragment(orjson.dumps(appointments))
+    cache = {
+        'json': orjson.dumps({'status': 'success', 'count': len(appointments), 'appointments': fragment}),
+        'fragment': fragment,
+        'last_result': last_result,
+        'count': len(appointments)
+    }
+    cache['json_gz'] = gzip.compress(cache['json'], compresslevel=GZIP_LEVEL)
+    cache['etag'] = payload_etag(cache['json'])
+    return cache
+
+
+def cached_msgpack(cache, key):
+    """
+    Get a MessagePack body from the appointments cache, rendering it on first use.
     
+    Few clients ask for MessagePack, so its bodies are only kept in memory
+    for runs that are actually requested that way. They are decoded from
+    the cached JSON rather than from the appointments list.
+    
+    Args:
+        cache: Appointments cache from build_appointments_cache
+        key: 'msgpack' for the /appointments body or 'results_msgpack'
+            for the /results body
+    
+    Returns:
+        Tuple of (body, gzipped body)
+    """
+    with _msgpack_lock:
+        if key not in cache:
+            payload = orjson.loads(cache['json'])
+            if key == 'results_msgpack':
+                payload = results_payload({
+                    **cache['last_result'],
+                    'appointments': payload['appointments'],
+                    'appointments_count': cache['count']
+                })
+            body = msgpack.packb(payload)
+            cache[key + '_gz'] = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            cache[key] = body
+        return cache[key], cache[key + '_gz']
+
+
+def results_payload(result_data):
+    """
+    Wrap a run summary in the /results envelope.
+    
+    Args:
+        result_data: Run summary, with appointments spliced in if any
+    
+    Returns:
+        Dictionary with the run 'status' and the 'result'
+    """
+    status = 'success' if result_data.get('success') else 'failed'
+    return {'status': status, 'result': result_data}
+
+
+def wants_msgpack():
+    """Return True when the client prefers MessagePack over JSON."""
+    return request.accept_mimetypes.best_match(
+        ['application/json', MSGPACK_MIMETYPE]
+    ) == MSGPACK_MIMETYPE
+
+
+def accepts_gzip():
+    """Return True when the client accepts gzip with a non-zero quality."""
+    return request.accept_encodings['gzip'] > 0
+
+
+def negotiated_etag(etag):
+    """
+    Derive the ETag of the representation this request will receive.
+    
+    Args:
+        etag: ETag of the underlying payload
+    
+    Returns:
+        ETag distinguishing the MessagePack and gzip variants
+    """
+    if wants_msgpack():
+        etag += '-msgpack'
+    if accepts_gzip():
+        etag += '-gzip'
+    return etag
+
+
+def not_modified(etag):
+    """Return a 304 response when the client already holds this ETag, else None."""
+    if not request.if_none_match.contains(etag):
+        return None
+    
+    response = Response(status=304, headers={'Vary': VARY_HEADERS})
+    response.set_etag(etag)
+    return response
+
+
+def encoded_response(body, mimetype, gzipped=None, etag=None):
+    """
+    Build a response, gzip-encoding the body when the client accepts it.
+    
+    Args:
+        body: Serialized response bytes
+        mimetype: Response content type
+        gzipped: Pre-compressed body, compressed on demand if omitted
+        etag: Representation ETag from negotiated_etag, if any
+    
+    Returns:
+        Flask Response
+    """
+    headers = {'Vary': VARY_HEADERS}
+    
+    if accepts_gzip():
+        body = gzipped if gzipped is not None else gzip.compress(body, compresslevel=GZIP_LEVEL)
+        headers['Content-Encoding'] = 'gzip'
+    
+    response = Response(body, status=200, mimetype=mimetype, headers=headers)
+    if etag is not None:
+        response.set_etag(etag)
+    return response
+
+
+def iter_appointments_csv(path):
+    """
+    Render the Parquet appointments store as CSV in fixed-size chunks.
+    
+    Args:
+        path: Parquet file written by write_appointments_store
+    
+    Yields:
+        CSV text: the header row first, so an empty store still produces a
+        header-only file, then one chunk per batch
+    """
+    parquet_file = pq.ParquetFile(path)
+    
+    # Reuse one buffer for every chunk instead of allocating per chunk
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(parquet_file.schema_arrow.names)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    
+    for batch in parquet_file.iter_batches(batch_size=CSV_CHUNK_SIZE):
+        columns = batch.to_pydict()
+        writer.writerows(zip(*columns.values()))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def is_scraper_running():
+    """Return True while a submitted scraper run has not finished."""
+    return _scraper_future is not None and not _scraper_future.done()
+
+
+def run_scraper_async():
+    """Run scraper on the background executor."""
     logger = logging.getLogger('zocdoc_scraper')
     
     try:
-        scraper_status['running'] = True
         scraper_status['last_run'] = 'in_progress'
         
         logger.info("Starting scraper execution...")
@@ -40,27 +361,31 @@ def run_scraper_async():
         
         # Store appointments data
         if result['success'] and scraper.appointments:
-            scraper_status['appointments'] = scraper.appointments
-            result['appointments'] = scraper.appointments
-            logger.info(f"Stored {len(scraper.appointments)} appointments in memory")
-        
-        scraper_status['last_result'] = result
-        scraper_status['running'] = False
+            cache = build_appointments_cache(scraper.appointments, result)
+            store_path = write_appointments_store(scraper.appointments, appointments_store_path(cache['etag']))
+            previous_path = scraper_status['snapshot']['appointments']
+            publish_snapshot(
+                last_result=result,
+                appointments=store_path,
+                appointments_cache=cache
+            )
+            prune_appointments_stores(keep={store_path, previous_path})
+            logger.info("Stored %s appointments in %s", len(scraper.appointments), store_path)
+        else:
+            publish_snapshot(last_result=result)
         
         if result['success']:
             logger.info("✅ Scraper completed successfully")
         else:
-            logger.error(f"❌ Scraper failed: {result.get('error')}")
+            logger.error("❌ Scraper failed: %s", result.get('error'))
     
     except Exception as e:
-        logger.error(f"Scraper execution failed: {str(e)}")
-        logger.error(traceback.format_exc())
-        scraper_status['last_result'] = {
+        logger.exception("Scraper execution failed: %s", e)
+        publish_snapshot(last_result={
             'success': False,
             'error': str(e),
             'error_type': type(e).__name__
-        }
-        scraper_status['running'] = False
+        })
 
 
 @app.route('/', methods=['GET', 'POST'])
@@ -74,25 +399,25 @@ def trigger_scraper():
     Returns:
         JSON response with execution status
     """
-    logger = logging.getLogger('zocdoc_scraper')
+    global _scraper_future
     
-    # Check if scraper is already running
-    if scraper_status['running']:
-        return jsonify({
-            'status': 'already_running',
-            'message': 'Scraper is already running. Please wait for completion.'
-        }), 409
+    logger = logging.getLogger('zocdoc_scraper')
     
     # Parse optional parameters from POST body
     params = {}
     if request.method == 'POST' and request.is_json:
         params = request.get_json()
-        logger.info(f"Received trigger request with params: {params}")
+        logger.info("Received trigger request with params: %s", params)
     
-    # Start scraper in background thread
-    thread = Thread(target=run_scraper_async)
-    thread.daemon = True
-    thread.start()
+    # Check-and-submit under the lock so concurrent triggers cannot both start a run
+    with _trigger_lock:
+        if is_scraper_running():
+            return jsonify({
+                'status': 'already_running',
+                'message': 'Scraper is already running. Please wait for completion.'
+            }), 409
+        
+        _scraper_future = _executor.submit(run_scraper_async)
     
     return jsonify({
         'status': 'started',
@@ -112,7 +437,7 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'zocdoc-scraper',
-        'running': scraper_status['running']
+        'running': is_scraper_running()
     }), 200
 
 
@@ -125,8 +450,8 @@ def get_status():
         JSON response with current and last execution status
     """
     return jsonify({
-        'running': scraper_status['running'],
-        'last_result': scraper_status['last_result']
+        'running': is_scraper_running(),
+        'last_result': scraper_status['snapshot']['last_result']
     }), 200
 
 
@@ -138,23 +463,43 @@ def get_results():
     Returns:
         JSON response with last execution results and appointments
     """
-    if scraper_status['last_result'] is None:
+    snapshot = scraper_status['snapshot']
+    last_result = snapshot['last_result']
+    
+    if last_result is None:
         return jsonify({
             'status': 'no_results',
             'message': 'No scraper runs completed yet'
         }), 404
     
-    result_data = scraper_status['last_result'].copy()
+    etag = negotiated_etag(snapshot['results_etag'])
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
     
-    # Include appointments in response
-    if scraper_status['appointments']:
-        result_data['appointments'] = scraper_status['appointments']
-        result_data['appointments_count'] = len(scraper_status['appointments'])
+    cache = snapshot['appointments_cache']
     
-    return jsonify({
-        'status': 'success' if scraper_status['last_result'].get('success') else 'failed',
-        'result': result_data
-    }), 200
+    if wants_msgpack():
+        # Rendered once per run; runs without appointments only pack the summary
+        if cache:
+            body, body_gz = cached_msgpack(cache, 'results_msgpack')
+            return encoded_response(body, MSGPACK_MIMETYPE, body_gz, etag)
+        return encoded_response(msgpack.packb(results_payload(last_result)), MSGPACK_MIMETYPE, etag=etag)
+    
+    # Splice the pre-serialized appointments array in rather than re-encoding it
+    result_data = last_result
+    if cache:
+        result_data = {
+            **last_result,
+            'appointments': cache['fragment'],
+            'appointments_count': cache['count']
+        }
+    payload = orjson.dumps(
+        results_payload(result_data),
+        default=app.json.default,
+        option=ORJSON_OPTIONS
+    )
+    return encoded_response(payload, 'application/json', etag=etag)
 
 
 @app.route('/appointments', methods=['GET'])
@@ -165,10 +510,15 @@ def get_appointments():
     Query params:
         format: 'json' (default) or 'csv'
     
+    Clients sending 'Accept: application/msgpack' receive MessagePack
+    instead of JSON.
+    
     Returns:
-        JSON array of appointments or CSV download
+        JSON array of appointments, MessagePack body or CSV download
     """
-    if not scraper_status['appointments']:
+    snapshot = scraper_status['snapshot']
+    
+    if not snapshot['appointments']:
         return jsonify({
             'status': 'no_appointments',
             'message': 'No appointments available. Run the scraper first.',
@@ -178,31 +528,31 @@ def get_appointments():
     format_type = request.args.get('format', 'json').lower()
     
     if format_type == 'csv':
-        # Return CSV
-        df = pd.DataFrame(scraper_status['appointments'])
-        csv_data = df.to_csv(index=False)
-        
-        from flask import Response
+        # Stream CSV from the Parquet store one row group batch at a time
         return Response(
-            csv_data,
+            iter_appointments_csv(snapshot['appointments']),
             mimetype='text/csv',
             headers={'Content-Disposition': 'attachment; filename=appointments.csv'}
         )
-    else:
-    # Return JSON
-        return jsonify({
-            'status': 'success',
-            'count': len(scraper_status['appointments']),
-            'appointments': scraper_status['appointments']
-        }), 200
+    
+    # Return pre-serialized (and pre-compressed) payload
+    cache = snapshot['appointments_cache']
+    etag = negotiated_etag(cache['etag'])
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+    
+    if wants_msgpack():
+        body, body_gz = cached_msgpack(cache, 'msgpack')
+        return encoded_response(body, MSGPACK_MIMETYPE, body_gz, etag)
+    return encoded_response(cache['json'], 'application/json', cache['json_gz'], etag)
 
 
 @app.errorhandler(Exception)
 def handle_error(error):
     """Global error handler."""
     logger = logging.getLogger('zocdoc_scraper')
-    logger.error(f"Unhandled error: {str(error)}")
-    logger.error(traceback.format_exc())
+    logger.exception("Unhandled error: %s", error)
     
     return jsonify({
         'status': 'error',
@@ -211,6 +561,8 @@ def handle_error(error):
 
 
 if __name__ == '__main__':
+    # Local development only; containers run app:app under gunicorn (see Dockerfile)
+    
     # Setup logging
     logger = setup_logging()
     logger.info("Starting ZocDoc Scraper HTTP Server...")
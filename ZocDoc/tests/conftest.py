@@ -5,44 +5,170 @@ Pytest configuration and shared fixtures for ZocDoc scraper tests.
 import pytest
 import os
 import sys
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
 
 # Add parent directory to path so tests can import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+# Fixture HTML, encoded once so BeautifulSoup skips encoding detection
+WORKFLOW_HTML = b'''
+<html>
+    <body>
+        <div data-test="availability-modal-view-container">
+            <div data-test="availability-modal-content-date-wrapper">
+                <div data-test="availability-modal-content-day-title">Mon, Jan 26</div>
+                <a data-test="availability-modal-timeslot">9:30 am</a>
+                <a data-test="availability-modal-timeslot">10:00 am</a>
+            </div>
+            <div data-test="availability-modal-content-date-wrapper">
+                <div data-test="availability-modal-content-day-title">Tue, Jan 27</div>
+                <a data-test="availability-modal-timeslot">2:00 pm</a>
+            </div>
+        </div>
+    </body>
+</html>
+'''
+
+# Modal before clicking "Show more availability"
+SHOW_MORE_INITIAL_HTML = b'''
+<div data-test="availability-modal-view-container">
+    <a data-test="availability-modal-timeslot">9:30 am</a>
+    <a data-test="availability-modal-timeslot">10:00 am</a>
+</div>
+'''
+
+# Modal after clicking "Show more availability"
+SHOW_MORE_UPDATED_HTML = b'''
+<div data-test="availability-modal-view-container">
+    <a data-test="availability-modal-timeslot">9:30 am</a>
+    <a data-test="availability-modal-timeslot">10:00 am</a>
+    <a data-test="availability-modal-timeslot">11:00 am</a>
+    <a data-test="availability-modal-timeslot">2:00 pm</a>
+</div>
+'''
+
+NO_APPOINTMENTS_HTML = b'''
+<div data-test="availability-modal-view-container">
+    <div class="no-availability">No appointments available</div>
+</div>
+'''
+
+MISSING_DATE_TITLE_HTML = b'''
+<div data-test="availability-modal-view-container">
+    <div data-test="availability-modal-content-date-wrapper">
+        <a data-test="availability-modal-timeslot">9:30 am</a>
+    </div>
+</div>
+'''
+
+MALFORMED_TIMESLOT_HTML = b'''
+<div data-test="availability-modal-view-container">
+    <div data-test="availability-modal-content-date-wrapper">
+        <div data-test="availability-modal-content-day-title">Mon, Jan 26</div>
+        <a data-test="availability-modal-timeslot"></a>
+        <a data-test="availability-modal-timeslot">10:00 am</a>
+    </div>
+</div>
+'''
+
+
+@pytest.fixture(scope="session")
+def html_parser():
+    """Fixture providing one lxml HTML parser shared by the whole test session."""
+    return lxml_html.HTMLParser(recover=True, remove_blank_text=False)
+
+
+# Fixture bytes are declared utf-8 rather than sniffed
+_UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def _tree(markup):
+    """Parse fixture bytes into an lxml element tree."""
+    return lxml_html.fromstring(markup, parser=_UTF8_PARSER)
+
+
+# Only availability-modal nodes become Tags; the rest is dropped while parsing
+_AVAILABILITY_STRAINER = SoupStrainer(attrs={'data-test': [
+    'availability-modal-view-container',
+    'availability-modal-content-date-wrapper',
+    'availability-modal-content-day-title',
+    'availability-modal-timeslot',
+]})
+
+
+def _soup(markup):
+    """Parse fixture bytes with the lxml tree builder, keeping availability nodes only."""
+    return BeautifulSoup(markup, 'lxml', from_encoding='utf-8', parse_only=_AVAILABILITY_STRAINER)
+
+
+@pytest.fixture(scope="session")
+def workflow_tree():
+    """Fixture providing the parsed two-day workflow modal page as an lxml tree."""
+    return _tree(WORKFLOW_HTML)
+
+
+@pytest.fixture(scope="session")
+def show_more_initial_soup():
+    """Fixture providing the modal before 'Show more availability' is clicked."""
+    return _soup(SHOW_MORE_INITIAL_HTML)
+
+
+@pytest.fixture(scope="session")
+def unwrapped_timeslots_tree():
+    """Fixture providing timeslots outside any date wrapper as an lxml tree."""
+    return _tree(SHOW_MORE_INITIAL_HTML)
+
+
+@pytest.fixture(scope="session")
+def show_more_updated_soup():
+    """Fixture providing the modal after 'Show more availability' is clicked."""
+    return _soup(SHOW_MORE_UPDATED_HTML)
+
+
+@pytest.fixture(scope="session")
+def no_appointments_soup():
+    """Fixture providing a modal with no available appointments."""
+    return _soup(NO_APPOINTMENTS_HTML)
+
+
+@pytest.fixture(scope="session")
+def missing_date_title_tree():
+    """Fixture providing a date wrapper without a day title as an lxml tree."""
+    return _tree(MISSING_DATE_TITLE_HTML)
+
+
+@pytest.fixture(scope="session")
+def malformed_timeslot_tree():
+    """Fixture providing a date wrapper containing an empty timeslot as an lxml tree."""
+    return _tree(MALFORMED_TIMESLOT_HTML)
+
+
+def _appointment(doctor, date, time):
+    """Build one appointment row, deriving 'datetime' from date and time."""
+    return {'doctor': doctor, 'date': date, 'time': time, 'datetime': f"{date} {time}"}
+
+
+@pytest.fixture(scope="session")
+def make_appointment():
+    """Fixture providing the appointment row factory, called as make_appointment(doctor, date, time)."""
+    return _appointment
+
+
 @pytest.fixture
 def sample_appointment():
     """Fixture providing a sample appointment dict."""
-    return {
-        'doctor': 'Dr. Michael Ayzin, DDS',
-        'date': 'Mon, Jan 26',
-        'time': '9:30 am',
-        'datetime': 'Mon, Jan 26 9:30 am'
-    }
+    return _appointment('Dr. Michael Ayzin, DDS', 'Mon, Jan 26', '9:30 am')
 
 
 @pytest.fixture
 def sample_appointments_list():
     """Fixture providing a list of sample appointments."""
     return [
-        {
-            'doctor': 'Dr. Michael Ayzin, DDS',
-            'date': 'Mon, Jan 26',
-            'time': '9:30 am',
-            'datetime': 'Mon, Jan 26 9:30 am'
-        },
-        {
-            'doctor': 'Dr. Michael Ayzin, DDS',
-            'date': 'Mon, Jan 26',
-            'time': '10:00 am',
-            'datetime': 'Mon, Jan 26 10:00 am'
-        },
-        {
-            'doctor': 'Dr. Michael Ayzin, DDS',
-            'date': 'Tue, Jan 27',
-            'time': '2:00 pm',
-            'datetime': 'Tue, Jan 27 2:00 pm'
-        }
+        _appointment('Dr. Michael Ayzin, DDS', 'Mon, Jan 26', '9:30 am'),
+        _appointment('Dr. Michael Ayzin, DDS', 'Mon, Jan 26', '10:00 am'),
+        _appointment('Dr. Michael Ayzin, DDS', 'Tue, Jan 27', '2:00 pm')
     ]
 
 
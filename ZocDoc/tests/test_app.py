@@ -0,0 +1,153 @@
+"""
+Tests for the Flask HTTP server.
+Tests conditional requests, content negotiation, CSV streaming and /results payloads.
+"""
+
+import csv
+import gzip
+import io
+
+import msgpack
+import pytest
+
+import app as server
+
+
+APPOINTMENTS = [
+    {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Mon, Jan 26', 'time': f'{hour}:00 am',
+     'datetime': f'Mon, Jan 26 {hour}:00 am', 'scraped_at': '2026-01-25T08:00:00'}
+    for hour in range(1, 6)
+]
+LAST_RESULT = {'success': True, 'appointments_count': 5, 'duration': 12.5, 'proxy_used': 'primary'}
+
+
+def publish_run(tmp_path, monkeypatch, appointments):
+    """Publish a finished run the way run_scraper_async does, in a temporary store directory."""
+    monkeypatch.setattr(server, 'APPOINTMENTS_STORE_DIR', tmp_path)
+    monkeypatch.setitem(server.scraper_status, 'snapshot', server.scraper_status['snapshot'])
+    
+    cache = server.build_appointments_cache(appointments, LAST_RESULT)
+    store_path = server.write_appointments_store(appointments, server.appointments_store_path(cache['etag']))
+    server.publish_snapshot(last_result=LAST_RESULT, appointments=store_path, appointments_cache=cache)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client with a published five-appointment run."""
+    publish_run(tmp_path, monkeypatch, APPOINTMENTS)
+    return server.app.test_client()
+
+
+class TestConditionalRequests:
+    """Test ETag handling and 304 responses."""
+    
+    @pytest.mark.parametrize("path", ['/appointments', '/results'])
+    def test_matching_etag_returns_304(self, client, path):
+        """Test a repeated request with the served ETag gets an empty 304."""
+        first = client.get(path)
+        second = client.get(path, headers={'If-None-Match': first.headers['ETag']})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == first.headers['ETag']
+    
+    def test_stale_etag_returns_body(self, client):
+        """Test a non-matching ETag gets the full body."""
+        response = client.get('/appointments', headers={'If-None-Match': '"stale"'})
+        
+        assert response.status_code == 200
+        assert response.json['count'] == len(APPOINTMENTS)
+
+
+class TestContentNegotiation:
+    """Test gzip and MessagePack negotiation."""
+    
+    @pytest.mark.parametrize("accept_encoding,gzipped", [
+        ('gzip', True),
+        ('gzip, deflate', True),
+        ('identity', False),
+        ('gzip;q=0', False),
+    ])
+    def test_gzip_negotiation(self, client, accept_encoding, gzipped):
+        """Test gzip is used only when accepted with a non-zero quality, and the ETag says so."""
+        plain = client.get('/appointments', headers={'Accept-Encoding': 'identity'})
+        response = client.get('/appointments', headers={'Accept-Encoding': accept_encoding})
+        
+        assert (response.headers.get('Content-Encoding') == 'gzip') is gzipped
+        assert response.headers['ETag'].endswith('-gzip"') is gzipped
+        body = gzip.decompress(response.data) if gzipped else response.data
+        assert body == plain.data
+    
+    @pytest.mark.parametrize("path", ['/appointments', '/results'])
+    def test_msgpack_matches_json(self, client, path):
+        """Test MessagePack and JSON bodies carry the same payload under distinct ETags."""
+        as_json = client.get(path, headers={'Accept': 'application/json'})
+        as_msgpack = client.get(path, headers={'Accept': 'application/msgpack'})
+        
+        assert as_json.mimetype == 'application/json'
+        assert as_msgpack.mimetype == server.MSGPACK_MIMETYPE
+        assert msgpack.unpackb(as_msgpack.data) == as_json.json
+        assert as_msgpack.headers['ETag'] != as_json.headers['ETag']
+    
+    def test_msgpack_rendered_on_first_request(self, client):
+        """Test MessagePack bodies are built only once a client asks for them, then reused."""
+        cache = server.scraper_status['snapshot']['appointments_cache']
+        assert 'msgpack' not in cache
+        
+        first = client.get('/appointments', headers={'Accept': 'application/msgpack'})
+        body = cache['msgpack']
+        second = client.get('/appointments', headers={'Accept': 'application/msgpack'})
+        
+        assert first.data == second.data == body
+        assert cache['msgpack'] is body
+        assert 'results_msgpack' not in cache
+    
+    def test_json_is_default(self, client):
+        """Test clients without an Accept preference get JSON."""
+        assert client.get('/appointments').mimetype == 'application/json'
+
+
+class TestCSVStreaming:
+    """Test CSV export streamed from the Parquet store."""
+    
+    def test_empty_store_is_header_only(self, tmp_path, monkeypatch):
+        """Test a store without rows still produces the header row."""
+        publish_run(tmp_path, monkeypatch, [])
+        
+        response = server.app.test_client().get('/appointments?format=csv')
+        
+        assert response.status_code == 200
+        assert response.data.decode() == ','.join(APPOINTMENTS[0]) + '\n'
+    
+    def test_rows_across_batches(self, client, monkeypatch):
+        """Test rows from several batches follow a single header, in order."""
+        monkeypatch.setattr(server, 'CSV_CHUNK_SIZE', 2)
+        
+        response = client.get('/appointments?format=csv')
+        rows = list(csv.DictReader(io.StringIO(response.data.decode())))
+        
+        assert response.mimetype == 'text/csv'
+        assert rows == APPOINTMENTS
+
+
+class TestResults:
+    """Test the /results payload."""
+    
+    def test_results_body(self, client):
+        """Test the spliced appointments array equals a plain encoding of the same result."""
+        response = client.get('/results')
+        
+        assert response.json == {
+            'status': 'success',
+            'result': {**LAST_RESULT, 'appointments': APPOINTMENTS, 'appointments_count': len(APPOINTMENTS)}
+        }
+    
+    def test_results_etag_changes_with_run(self, tmp_path, monkeypatch, client):
+        """Test a new run's payload is served under a new ETag."""
+        before = client.get('/results').headers['ETag']
+        publish_run(tmp_path, monkeypatch, APPOINTMENTS[:2])
+        after = client.get('/results')
+        
+        assert after.headers['ETag'] != before
+        assert after.json['result']['appointments_count'] == 2
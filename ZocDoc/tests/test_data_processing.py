@@ -5,10 +5,16 @@ Tests pandas DataFrame operations and data validation.
 
 import pytest
 import pandas as pd
-import os
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import tempfile
 from pathlib import Path
 
+from zocdoc_scraper_production import (
+    APPOINTMENT_COLUMNS, DOCTOR_PATTERN, TIME_PATTERN, RawAppointmentWriter, appointments_table,
+    validate_appointments
+)
+
 
 class TestDataFrameCreation:
     """Test DataFrame creation from appointment data."""
@@ -75,7 +81,7 @@ class TestDuplicateRemoval:
         ]
         
         df = pd.DataFrame(appointments)
-        df_clean = df.drop_duplicates().reset_index(drop=True)
+        df_clean = df.drop_duplicates(ignore_index=True)
         
         assert len(df) == 3
         assert len(df_clean) == 2
@@ -104,59 +110,68 @@ class TestDuplicateRemoval:
         df_clean = df.drop_duplicates().reset_index(drop=True)
         
         assert len(df) == len(df_clean)
+    
+    def test_remove_duplicates_categorical(self):
+        """Test duplicate removal on category-typed doctor/date columns."""
+        appointments = [
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Mon, Jan 26', 'time': '9:30 am', 'datetime': 'Mon, Jan 26 9:30 am'},
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Mon, Jan 26', 'time': '9:30 am', 'datetime': 'Mon, Jan 26 9:30 am'},  # Duplicate
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Tue, Jan 27', 'time': '2:00 pm', 'datetime': 'Tue, Jan 27 2:00 pm'}
+        ]
+        
+        df = pd.DataFrame(appointments).astype({'doctor': 'category', 'date': 'category', 'time': 'category'})
+        df_clean = df.drop_duplicates(subset=['doctor', 'date', 'time'], ignore_index=True)
+        
+        assert len(df['doctor'].cat.categories) == 1
+        assert len(df_clean) == 2
+        assert list(df_clean.index) == [0, 1]
+        assert (df_clean.dtypes[['doctor', 'date', 'time']] == 'category').all()
+        assert list(df_clean['date']) == ['Mon, Jan 26', 'Tue, Jan 27']
 
 
 class TestCSVExport:
     """Test CSV file export functionality."""
     
+    # Small exports stay in memory; larger ones spill to a real temp file
+    SPOOL_MAX_SIZE = 1 << 20
+    
     def test_export_to_csv(self):
-        """Test exporting DataFrame to CSV."""
+        """Test exporting appointments to CSV."""
         appointments = [
             {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Mon, Jan 26', 'time': '9:30 am', 'datetime': 'Mon, Jan 26 9:30 am'},
             {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Tue, Jan 27', 'time': '2:00 pm', 'datetime': 'Tue, Jan 27 2:00 pm'}
         ]
         
-        df = pd.DataFrame(appointments)
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            temp_path = f.name
+        table = pa.Table.from_pylist(appointments)
         
-        try:
-            df.to_csv(temp_path, index=False)
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as f:
+            pacsv.write_csv(table, f)
             
-            # Verify file exists
-            assert os.path.exists(temp_path)
+            # Verify something was written
+            assert f.tell() > 0
             
             # Read back and verify
-            df_read = pd.read_csv(temp_path)
-            assert df_read.shape == df.shape
-            assert list(df_read.columns) == list(df.columns)
-            assert len(df_read) == len(df)
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            f.seek(0)
+            table_read = pacsv.read_csv(f)
+            assert table_read.shape == table.shape
+            assert table_read.column_names == table.column_names
+            assert table_read.num_rows == table.num_rows
     
     def test_export_empty_dataframe(self):
         """Test exporting empty DataFrame."""
         df = pd.DataFrame()
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            temp_path = f.name
-        
-        try:
-            df.to_csv(temp_path, index=False)
-            assert os.path.exists(temp_path)
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE, mode='w+') as f:
+            df.to_csv(f, index=False)
+            f.seek(0)
             
             # Empty CSV will raise EmptyDataError in pandas, that's expected
             try:
-                df_read = pd.read_csv(temp_path)
+                df_read = pd.read_csv(f)
                 assert len(df_read) == 0
             except pd.errors.EmptyDataError:
                 # This is expected for empty DataFrames
                 pass
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
     
     def test_csv_preserves_special_characters(self):
         """Test CSV export preserves special characters."""
@@ -165,20 +180,15 @@ class TestCSVExport:
             {'doctor': 'Dr. Smith-Jones, DDS', 'date': 'Tue, Jan 27', 'time': '2:00 pm', 'datetime': 'Tue, Jan 27 2:00 pm'}
         ]
         
-        df = pd.DataFrame(appointments)
+        table = pa.Table.from_pylist(appointments)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            temp_path = f.name
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as f:
+            pacsv.write_csv(table, f)
+            f.seek(0)
+            doctors = pacsv.read_csv(f).column('doctor').to_pylist()
         
-        try:
-            df.to_csv(temp_path, index=False)
-            df_read = pd.read_csv(temp_path)
-            
-            assert "O'Brien" in df_read.loc[0, 'doctor']
-            assert "Smith-Jones" in df_read.loc[1, 'doctor']
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        assert "O'Brien" in doctors[0]
+        assert "Smith-Jones" in doctors[1]
     
     def test_csv_column_order(self):
         """Test CSV maintains correct column order."""
@@ -186,22 +196,41 @@ class TestCSVExport:
             {'time': '9:30 am', 'doctor': 'Dr. Michael Ayzin, DDS', 'datetime': 'Mon, Jan 26 9:30 am', 'date': 'Mon, Jan 26'}
         ]
         
-        df = pd.DataFrame(appointments)
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            temp_path = f.name
+        table = pa.Table.from_pylist(appointments)
         
-        try:
-            df.to_csv(temp_path, index=False)
-            
-            with open(temp_path, 'r') as f:
-                header = f.readline().strip()
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as f:
+            pacsv.write_csv(table, f)
+            f.seek(0)
             
-            # Pandas will use the order from the dict (Python 3.7+ preserves insertion order)
-            assert header.split(',') == ['time', 'doctor', 'datetime', 'date']
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # Arrow keeps the order from the dict (Python 3.7+ preserves insertion order)
+            assert pacsv.read_csv(f).column_names == ['time', 'doctor', 'datetime', 'date']
+    
+    @pytest.mark.parametrize("suffix", ['.csv', '.parquet'])
+    def test_raw_writer_streams_batches(self, tmp_path, sample_appointments_list, suffix):
+        """Test raw appointments are appended batch by batch in both formats."""
+        writer = RawAppointmentWriter(tmp_path / f'raw{suffix}')
+        writer.write(sample_appointments_list[:2])
+        writer.write([])
+        writer.write(sample_appointments_list[2:])
+        writer.close()
+        writer.close()
+        
+        if suffix == '.csv':
+            df = pd.read_csv(writer.path, dtype=str)
+        else:
+            df = pd.read_parquet(writer.path)
+        
+        assert writer.rows == 3
+        assert list(df.columns) == APPOINTMENT_COLUMNS
+        assert list(df['time']) == [apt['time'] for apt in sample_appointments_list]
+    
+    def test_raw_writer_without_rows_creates_no_file(self, tmp_path):
+        """Test a run that scrapes nothing leaves no raw file behind."""
+        writer = RawAppointmentWriter(tmp_path / 'raw.csv')
+        writer.write([])
+        writer.close()
+        
+        assert not writer.path.exists()
 
 
 class TestDataValidation:
@@ -256,8 +285,9 @@ class TestDataValidation:
         ]
         
         for name in valid_names:
-            assert name.startswith('Dr.')
-            assert ',' in name
+            assert DOCTOR_PATTERN.match(name)
+        
+        assert not DOCTOR_PATTERN.match('Michael Ayzin, DDS')
     
     def test_validate_time_format(self):
         """Test validation of time format."""
@@ -269,9 +299,22 @@ class TestDataValidation:
         ]
         
         for time_str in valid_times:
-            assert ' ' in time_str
-            assert time_str.endswith('am') or time_str.endswith('pm')
-            assert ':' in time_str.split()[0]
+            assert TIME_PATTERN.match(time_str)
+        
+        assert not TIME_PATTERN.match('930 am')
+    
+    def test_validate_appointments_vectorized(self):
+        """Test the scraper's column-wise validator flags malformed rows."""
+        table = appointments_table([
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Mon, Jan 26', 'time': '9:30 am'},
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': '   ', 'time': '10:00 am'},  # Blank date
+            {'doctor': 'Michael Ayzin', 'date': 'Mon, Jan 26', 'time': '2:45 pm'},  # No "Dr." prefix
+            {'doctor': 'Dr. Michael Ayzin, DDS', 'date': 'Tue, Jan 27', 'time': 'noon'},  # Bad time
+            {'doctor': 'Dr. Jane Doe, DMD', 'date': 'Tue, Jan 27', 'time': '12:00 PM'},
+            {'doctor': 'Dr. Jane Doe, DMD', 'date': 'Tue, Jan 27'}  # Missing time
+        ])
+        
+        assert validate_appointments(table).to_pylist() == [True, False, False, False, True, False]
     
     def test_dataframe_integrity_after_operations(self):
         """Test DataFrame integrity after various operations."""
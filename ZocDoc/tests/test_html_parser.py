@@ -1,17 +1,123 @@
 """
 Unit tests for HTML parsing functionality.
-Tests BeautifulSoup extraction logic with various HTML structures.
+Tests BeautifulSoup and lxml extraction logic with various HTML structures.
 """
 
+import re
 import pytest
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import BeautifulSoup, SoupStrainer
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Optional
+from lxml import html as lxml_html
+from lxml.etree import XPath
+from cssselect import HTMLTranslator
+
+import zocdoc_scraper_production as scraper
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as LxbHTMLParser
+except ImportError:  # Optional C extension; tests fall back to BeautifulSoup on lxml
+    LxbHTMLParser = None
+
+
+# CSS selectors shared by the lxml and selectolax tests
+_TIMESLOT_CSS = 'a[data-test="availability-modal-timeslot"]'
+_DAY_TITLE_CSS = 'div[data-test="availability-modal-content-day-title"]'
+_DATE_WRAPPER_CSS = 'div[data-test="availability-modal-content-date-wrapper"]'
+_MODAL_CONTAINER_CSS = 'div[data-test="availability-modal-view-container"]'
+_MODAL_CONTENT_CSS = 'div[data-test="modal-content"]'
+
+
+# Compiled once and reused by every lxml-based test; plain selectors are
+# translated from CSS, the axis/text() queries are written as XPath directly
+_translator = HTMLTranslator()
+TIMESLOT_XPATH = XPath(_translator.css_to_xpath(_TIMESLOT_CSS))
+DAY_TITLE_XPATH = XPath(_translator.css_to_xpath(_DAY_TITLE_CSS))
+DATE_WRAPPER_XPATH = XPath(_translator.css_to_xpath(_DATE_WRAPPER_CSS))
+DATE_WRAPPER_ANCESTOR_XPATH = XPath('ancestor::div[@data-test="availability-modal-content-date-wrapper"]')
+WRAPPER_DAY_TITLE_TEXT_XPATH = XPath(
+    './/div[@data-test="availability-modal-content-date-wrapper"]'
+    '/div[@data-test="availability-modal-content-day-title"]/text()'
+)
+MODAL_CONTAINER_XPATH = XPath(_translator.css_to_xpath(_MODAL_CONTAINER_CSS))
+MODAL_CONTENT_XPATH = XPath(_translator.css_to_xpath(_MODAL_CONTENT_CSS))
+
+
+# Raw marker checked against page bytes without decoding them
+_TIMESLOT_MARKER = b'availability-modal-timeslot'
+
+
+# Characters the special-character/unicode tests expect to survive parsing;
+# searched on each element's own text node instead of a flattened get_text()
+_SPECIAL_CHECK_RE = re.compile('[–&]')
+_UNICODE_CHECK_RE = re.compile('[✓🕐]')
+
+
+# (date, time) key identifying a slot for duplicate checks
+_SLOT_KEY = itemgetter('date', 'time')
+
+
+# ZocDoc day titles ("Mon, Jan 26") and slot times ("9:30 am")
+_DATE_RE = re.compile(
+    r'(Mon|Tue|Wed|Thu|Fri|Sat|Sun), '
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) ([1-9]|[12]\d|3[01])'
+)
+_TIME_RE = re.compile(r'([1-9]|1[0-2]):([0-5]\d) (am|pm)')
+
+
+# 100-timeslot page for the large-HTML test, built once at import
+_LARGE_TIMESLOT_HTML = (
+    '<div data-test="availability-modal-view-container">'
+    '<div data-test="availability-modal-content-date-wrapper">'
+    '<div data-test="availability-modal-content-day-title">Mon, Jan 26</div>'
+    + ''.join(f'<a data-test="availability-modal-timeslot">{i}:00 am</a>' for i in range(1, 101))
+    + '</div></div>'
+)
+
+
+# BeautifulSoup attribute filters, allocated once instead of per find/find_all call
+_ATTR_TIMESLOT = {'data-test': 'availability-modal-timeslot'}
+_ATTR_DAY_TITLE = {'data-test': 'availability-modal-content-day-title'}
+_ATTR_MODAL_CONTAINER = {'data-test': 'availability-modal-view-container'}
+_ATTR_MODAL_CONTENT = {'data-test': 'modal-content'}
+_ATTR_DIALOG = {'role': 'dialog'}
+
+
+# Only build Tags for data-test anchors/divs; everything else is skipped at parse time
+_TIMESLOT_STRAINER = SoupStrainer(['a', 'div'], attrs={'data-test': True})
+
+
+# Trees are only read by these tests, so each HTML literal is parsed once and shared
+@lru_cache(maxsize=None)
+def _parse(html: str, parser: str = 'lxml', strained: bool = False) -> BeautifulSoup:
+    """Parse HTML into a cached BeautifulSoup tree, optionally through _TIMESLOT_STRAINER."""
+    return BeautifulSoup(html, parser, parse_only=_TIMESLOT_STRAINER if strained else None)
+
+
+def _select(html: str, selector: str, parser_name: str) -> List:
+    """Run a CSS selector with selectolax when installed, else BeautifulSoup on parser_name."""
+    if LxbHTMLParser is not None:
+        return LxbHTMLParser(html).css(selector)
+    return _parse(html, parser_name).select(selector)
+
+
+@lru_cache(maxsize=None)
+def _parse_document(html: str, parser: Optional[lxml_html.HTMLParser] = None) -> lxml_html.HtmlElement:
+    """Parse HTML into a cached lxml document, using the given parser if any."""
+    return lxml_html.document_fromstring(html, parser=parser)
+
+
+@pytest.fixture(scope="module")
+def parser_name() -> str:
+    """BeautifulSoup tree builder used by every parsing test in this module."""
+    return "lxml"
 
 
 class TestTimeslotExtraction:
     """Test appointment timeslot extraction from HTML."""
     
-    def test_extract_valid_timeslots(self):
+    def test_extract_valid_timeslots(self, html_parser):
         """Test extraction of valid appointment timeslots."""
         html = '''
         <div data-test="availability-modal-view-container">
@@ -23,15 +129,15 @@ class TestTimeslotExtraction:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        doc = _parse_document(html, html_parser)
+        timeslots = TIMESLOT_XPATH(doc)
         
         assert len(timeslots) == 3
-        assert timeslots[0].get_text(strip=True) == '9:30 am'
-        assert timeslots[1].get_text(strip=True) == '10:00 am'
-        assert timeslots[2].get_text(strip=True) == '11:30 am'
+        assert timeslots[0].text.strip() == '9:30 am'
+        assert timeslots[1].text.strip() == '10:00 am'
+        assert timeslots[2].text.strip() == '11:30 am'
     
-    def test_extract_empty_timeslots(self):
+    def test_extract_empty_timeslots(self, html_parser):
         """Test extraction when no timeslots are present."""
         html = '''
         <div data-test="availability-modal-view-container">
@@ -40,12 +146,12 @@ class TestTimeslotExtraction:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        doc = _parse_document(html, html_parser)
+        timeslots = TIMESLOT_XPATH(doc)
         
         assert len(timeslots) == 0
     
-    def test_extract_multiple_dates(self):
+    def test_extract_multiple_dates(self, html_parser):
         """Test extraction across multiple date wrappers."""
         html = '''
         <div data-test="availability-modal-view-container">
@@ -61,41 +167,35 @@ class TestTimeslotExtraction:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        date_wrappers = soup.find_all('div', {'data-test': 'availability-modal-content-date-wrapper'})
+        doc = _parse_document(html, html_parser)
+        date_wrappers = DATE_WRAPPER_XPATH(doc)
         
         assert len(date_wrappers) == 2
         
-        # Check first date
-        first_date = date_wrappers[0].find('div', {'data-test': 'availability-modal-content-day-title'})
-        assert first_date.get_text(strip=True) == 'Mon, Jan 26'
-        first_timeslots = date_wrappers[0].find_all('a', {'data-test': 'availability-modal-timeslot'})
-        assert len(first_timeslots) == 2
+        # Collect every wrapper's title and timeslots in one pass, then compare
+        titles = [title.strip() for title in WRAPPER_DAY_TITLE_TEXT_XPATH(doc)]
+        slots_per_wrapper = [TIMESLOT_XPATH(wrapper) for wrapper in date_wrappers]
         
-        # Check second date
-        second_date = date_wrappers[1].find('div', {'data-test': 'availability-modal-content-day-title'})
-        assert second_date.get_text(strip=True) == 'Tue, Jan 27'
-        second_timeslots = date_wrappers[1].find_all('a', {'data-test': 'availability-modal-timeslot'})
-        assert len(second_timeslots) == 2
+        assert titles == ['Mon, Jan 26', 'Tue, Jan 27']
+        assert [len(slots) for slots in slots_per_wrapper] == [2, 2]
     
-    def test_extract_with_malformed_html(self):
+    def test_extract_with_malformed_html(self, html_parser):
         """Test extraction with missing required elements."""
         html = '''
         <div data-test="availability-modal-view-container">
             <a data-test="availability-modal-timeslot">9:30 am</a>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        doc = _parse_document(html, html_parser)
+        timeslots = TIMESLOT_XPATH(doc)
         
         # Timeslots should still be found
         assert len(timeslots) == 1
         
         # But date wrapper should be missing
-        date_wrapper = timeslots[0].find_parent('div', {'data-test': 'availability-modal-content-date-wrapper'})
-        assert date_wrapper is None
+        assert DATE_WRAPPER_ANCESTOR_XPATH(timeslots[0]) == []
     
-    def test_extract_with_extra_whitespace(self):
+    def test_extract_with_extra_whitespace(self, html_parser):
         """Test extraction handles extra whitespace correctly."""
         html = '''
         <div data-test="availability-modal-view-container">
@@ -111,24 +211,23 @@ class TestTimeslotExtraction:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = _parse_document(html, html_parser)
         
-        date_title = soup.find('div', {'data-test': 'availability-modal-content-day-title'})
-        assert date_title.get_text(strip=True) == 'Mon, Jan 26'
+        date_title = DAY_TITLE_XPATH(doc)[0]
+        assert date_title.text.strip() == 'Mon, Jan 26'
         
-        timeslot = soup.find('a', {'data-test': 'availability-modal-timeslot'})
-        assert timeslot.get_text(strip=True) == '9:30 am'
+        timeslot = TIMESLOT_XPATH(doc)[0]
+        assert timeslot.text.strip() == '9:30 am'
     
-    def test_modal_container_detection(self):
+    def test_modal_container_detection(self, html_parser):
         """Test modal container detection with different selectors."""
         html_with_availability = '''
         <div data-test="availability-modal-view-container">
             <a data-test="availability-modal-timeslot">9:30 am</a>
         </div>
         '''
-        soup = BeautifulSoup(html_with_availability, 'html.parser')
-        container = soup.find('div', {'data-test': 'availability-modal-view-container'})
-        assert container is not None
+        doc = _parse_document(html_with_availability, html_parser)
+        assert len(MODAL_CONTAINER_XPATH(doc)) == 1
         
         html_with_modal_content = '''
         <div data-test="modal-content">
@@ -137,11 +236,10 @@ class TestTimeslotExtraction:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html_with_modal_content, 'html.parser')
-        container = soup.find('div', {'data-test': 'modal-content'})
-        assert container is not None
+        doc = _parse_document(html_with_modal_content, html_parser)
+        assert len(MODAL_CONTENT_XPATH(doc)) == 1
     
-    def test_timeslot_without_href(self):
+    def test_timeslot_without_href(self, html_parser):
         """Test timeslots that might not have href attributes."""
         html = '''
         <div data-test="availability-modal-view-container">
@@ -149,58 +247,44 @@ class TestTimeslotExtraction:
             <a data-test="availability-modal-timeslot" href="/book?time=1000">10:00 am</a>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        doc = _parse_document(html, html_parser)
+        timeslots = TIMESLOT_XPATH(doc)
         
         assert len(timeslots) == 2
-        assert timeslots[0].get_text(strip=True) == '9:30 am'
+        assert timeslots[0].text.strip() == '9:30 am'
         assert timeslots[0].get('href') is None
-        assert timeslots[1].get_text(strip=True) == '10:00 am'
+        assert timeslots[1].text.strip() == '10:00 am'
         assert timeslots[1].get('href') == '/book?time=1000'
 
 
 class TestDateParsing:
     """Test date parsing and formatting."""
     
-    def test_parse_standard_date_format(self):
+    @pytest.mark.parametrize("date_str", [
+        "Mon, Jan 26",
+        "Tue, Feb 3",
+        "Wed, Dec 31",
+        "Thu, Mar 5",
+        "Fri, Apr 15",
+        "Sat, May 20",
+        "Sun, Jun 1"
+    ])
+    def test_parse_standard_date_format(self, date_str):
         """Test parsing standard ZocDoc date format."""
-        date_strings = [
-            "Mon, Jan 26",
-            "Tue, Feb 3",
-            "Wed, Dec 31",
-            "Thu, Mar 5",
-            "Fri, Apr 15",
-            "Sat, May 20",
-            "Sun, Jun 1"
-        ]
-        
-        for date_str in date_strings:
-            assert len(date_str.split(',')) == 2
-            day, date = date_str.split(',')
-            assert day.strip() in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-            assert len(date.strip().split()) == 2  # Month and day
+        assert _DATE_RE.fullmatch(date_str)
     
-    def test_parse_time_format(self):
+    @pytest.mark.parametrize("time_str", [
+        "9:30 am",
+        "10:00 am",
+        "11:30 am",
+        "12:00 pm",
+        "1:00 pm",
+        "2:30 pm",
+        "4:45 pm"
+    ])
+    def test_parse_time_format(self, time_str):
         """Test parsing time format variations."""
-        time_strings = [
-            "9:30 am",
-            "10:00 am",
-            "11:30 am",
-            "12:00 pm",
-            "1:00 pm",
-            "2:30 pm",
-            "4:45 pm"
-        ]
-        
-        for time_str in time_strings:
-            parts = time_str.split()
-            assert len(parts) == 2
-            time_part, period = parts
-            assert period in ['am', 'pm']
-            assert ':' in time_part
-            hour, minute = time_part.split(':')
-            assert 1 <= int(hour) <= 12
-            assert 0 <= int(minute) <= 59
+        assert _TIME_RE.fullmatch(time_str)
 
 
 class TestAppointmentDataStructure:
@@ -224,20 +308,20 @@ class TestAppointmentDataStructure:
         assert isinstance(appointment['time'], str)
         assert isinstance(appointment['datetime'], str)
     
-    def test_appointment_datetime_concatenation(self):
+    @pytest.mark.parametrize("date,time", [
+        ('Mon, Jan 26', '9:30 am'),
+        ('Tue, Feb 3', '2:00 pm'),
+        ('Wed, Mar 5', '11:00 am')
+    ])
+    def test_appointment_datetime_concatenation(self, date, time):
         """Test datetime field is correctly concatenated."""
-        appointments = [
-            {'date': 'Mon, Jan 26', 'time': '9:30 am'},
-            {'date': 'Tue, Feb 3', 'time': '2:00 pm'},
-            {'date': 'Wed, Mar 5', 'time': '11:00 am'}
-        ]
+        apt = {'date': date, 'time': time}
         
-        for apt in appointments:
-            expected_datetime = f"{apt['date']} {apt['time']}"
-            apt['datetime'] = expected_datetime
-            assert apt['datetime'] == expected_datetime
-            assert apt['date'] in apt['datetime']
-            assert apt['time'] in apt['datetime']
+        expected_datetime = f"{apt['date']} {apt['time']}"
+        apt['datetime'] = expected_datetime
+        assert apt['datetime'] == expected_datetime
+        assert apt['date'] in apt['datetime']
+        assert apt['time'] in apt['datetime']
     
     def test_duplicate_detection(self):
         """Test detection of duplicate appointments."""
@@ -248,7 +332,7 @@ class TestAppointmentDataStructure:
         ]
         
         # Create set of unique (date, time) tuples
-        unique_times = {(apt['date'], apt['time']) for apt in appointments}
+        unique_times = frozenset(map(_SLOT_KEY, appointments))
         assert len(unique_times) == 2  # Should have only 2 unique
         
     def test_empty_appointment_list(self):
@@ -261,7 +345,8 @@ class TestAppointmentDataStructure:
 class TestHTMLStructureVariations:
     """Test handling of various HTML structure variations."""
     
-    def test_nested_modal_structure(self):
+    @pytest.mark.css_backend
+    def test_nested_modal_structure(self, parser_name):
         """Test deeply nested modal structure."""
         html = '''
         <div role="dialog">
@@ -279,37 +364,33 @@ class TestHTMLStructureVariations:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
-        
         # Should find modal content regardless of nesting
-        modal_content = soup.find('div', {'data-test': 'modal-content'})
-        assert modal_content is not None
+        assert len(_select(html, _MODAL_CONTENT_CSS, parser_name)) == 1
         
         # Should find availability container
-        availability_container = soup.find('div', {'data-test': 'availability-modal-view-container'})
-        assert availability_container is not None
+        assert len(_select(html, _MODAL_CONTAINER_CSS, parser_name)) == 1
         
         # Should find timeslots
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        timeslots = _select(html, _TIMESLOT_CSS, parser_name)
         assert len(timeslots) == 1
     
-    def test_missing_modal_container(self):
+    def test_missing_modal_container(self, parser_name):
         """Test handling when modal container is missing."""
         html = '''
         <div role="dialog">
             <a data-test="availability-modal-timeslot">9:30 am</a>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = _parse(html, parser_name, strained=True)
         
-        container = soup.find('div', {'data-test': 'availability-modal-view-container'})
+        container = soup.find('div', _ATTR_MODAL_CONTAINER)
         assert container is None
         
         # But timeslots should still be found
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        timeslots = soup.find_all('a', _ATTR_TIMESLOT)
         assert len(timeslots) == 1
     
-    def test_multiple_modals_on_page(self):
+    def test_multiple_modals_on_page(self, parser_name):
         """Test handling when multiple modals exist on page."""
         html = '''
         <div role="dialog" id="modal1">
@@ -323,23 +404,23 @@ class TestHTMLStructureVariations:
             </div>
         </div>
         '''
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = _parse(html, parser_name)
         
         # Should find multiple dialogs
-        dialogs = soup.find_all('div', {'role': 'dialog'})
+        dialogs = soup.find_all('div', _ATTR_DIALOG)
         assert len(dialogs) == 2
         
         # But only one availability container
-        availability_container = soup.find('div', {'data-test': 'availability-modal-view-container'})
+        availability_container = soup.find('div', _ATTR_MODAL_CONTAINER)
         assert availability_container is not None
         
         # Should find timeslots only in the correct modal
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        timeslots = soup.find_all('a', _ATTR_TIMESLOT)
         assert len(timeslots) == 1
     
     def test_timeslots_in_page_html(self):
         """Test checking if timeslots exist in page HTML."""
-        html_with_timeslots = '''
+        html_with_timeslots = b'''
         <html>
             <body>
                 <div data-test="availability-modal-view-container">
@@ -348,101 +429,110 @@ class TestHTMLStructureVariations:
             </body>
         </html>
         '''
-        assert 'availability-modal-timeslot' in html_with_timeslots
+        assert _TIMESLOT_MARKER in html_with_timeslots
         
-        html_without_timeslots = '''
+        html_without_timeslots = b'''
         <html>
             <body>
                 <div class="no-appointments">No availability</div>
             </body>
         </html>
         '''
-        assert 'availability-modal-timeslot' not in html_without_timeslots
+        assert _TIMESLOT_MARKER not in html_without_timeslots
 
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
     
-    def test_empty_html(self):
-        """Test handling of empty HTML."""
-        html = ''
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
-        assert len(timeslots) == 0
-    
-    def test_invalid_html(self):
-        """Test handling of malformed HTML."""
-        html = '<div><a data-test="availability-modal-timeslot">9:30 am'  # Missing closing tags
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # BeautifulSoup should handle gracefully
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
-        assert len(timeslots) == 1
-        assert timeslots[0].get_text(strip=True) == '9:30 am'
-    
-    def test_special_characters_in_text(self):
-        """Test handling of special characters."""
-        html = '''
-        <div data-test="availability-modal-view-container">
-            <div data-test="availability-modal-content-day-title">Mon, Jan 26 – Special</div>
-            <a data-test="availability-modal-timeslot">9:30 am & more</a>
-        </div>
-        '''
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        date_title = soup.find('div', {'data-test': 'availability-modal-content-day-title'})
-        assert '–' in date_title.get_text(strip=True)
-        
-        timeslot = soup.find('a', {'data-test': 'availability-modal-timeslot'})
-        assert '&' in timeslot.get_text(strip=True)
+    @pytest.mark.parametrize("html,expected_texts", [
+        pytest.param('', [], id="empty_html"),
+        pytest.param(
+            '<div><a data-test="availability-modal-timeslot">9:30 am',  # Missing closing tags
+            ['9:30 am'],
+            id="invalid_html"
+        ),
+        pytest.param(
+            '''
+            <div data-test="availability-modal-view-container">
+                <a data-test="AVAILABILITY-MODAL-TIMESLOT">9:30 am</a>
+                <a data-test="availability-modal-timeslot">10:00 am</a>
+            </div>
+            ''',
+            ['10:00 am'],  # Only the exact (case-sensitive) match
+            id="case_sensitive_attributes"
+        ),
+    ])
+    def test_timeslot_extraction_edge(self, parser_name, html, expected_texts):
+        """Test timeslot extraction from empty, malformed and near-miss HTML."""
+        soup = _parse(html, parser_name, strained=True)
+        timeslots = soup.find_all('a', _ATTR_TIMESLOT)
+        
+        assert [slot.string.strip() for slot in timeslots] == expected_texts
     
-    def test_unicode_characters(self):
-        """Test handling of unicode characters."""
-        html = '''
-        <div data-test="availability-modal-view-container">
-            <div data-test="availability-modal-content-day-title">Mon, Jan 26 ✓</div>
-            <a data-test="availability-modal-timeslot">9:30 am 🕐</a>
-        </div>
-        '''
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        date_title = soup.find('div', {'data-test': 'availability-modal-content-day-title'})
-        assert '✓' in date_title.get_text(strip=True)
-        
-        timeslot = soup.find('a', {'data-test': 'availability-modal-timeslot'})
-        assert '🕐' in timeslot.get_text(strip=True)
+    @pytest.mark.parametrize("html,pattern,expected", [
+        pytest.param(
+            '''
+            <div data-test="availability-modal-view-container">
+                <div data-test="availability-modal-content-day-title">Mon, Jan 26 – Special</div>
+                <a data-test="availability-modal-timeslot">9:30 am & more</a>
+            </div>
+            ''',
+            _SPECIAL_CHECK_RE,
+            ('–', '&'),
+            id="special_characters"
+        ),
+        pytest.param(
+            '''
+            <div data-test="availability-modal-view-container">
+                <div data-test="availability-modal-content-day-title">Mon, Jan 26 ✓</div>
+                <a data-test="availability-modal-timeslot">9:30 am 🕐</a>
+            </div>
+            ''',
+            _UNICODE_CHECK_RE,
+            ('✓', '🕐'),
+            id="unicode_characters"
+        ),
+    ])
+    def test_text_characters_preserved(self, parser_name, html, pattern, expected):
+        """Test special and unicode characters survive parsing in titles and timeslots."""
+        soup = _parse(html, parser_name, strained=True)
+        
+        date_title = soup.find('div', _ATTR_DAY_TITLE)
+        timeslot = soup.find('a', _ATTR_TIMESLOT)
+        
+        assert (
+            pattern.search(date_title.string).group(),
+            pattern.search(timeslot.string).group()
+        ) == expected
     
-    def test_very_large_html(self):
+    @pytest.mark.css_backend
+    def test_very_large_html(self, parser_name):
         """Test handling of large HTML with many timeslots."""
-        # Generate HTML with 100 timeslots
-        timeslot_html = '\n'.join([
-            f'<a data-test="availability-modal-timeslot">{i}:00 am</a>'
-            for i in range(1, 101)
-        ])
-        html = f'''
-        <div data-test="availability-modal-view-container">
-            <div data-test="availability-modal-content-date-wrapper">
-                <div data-test="availability-modal-content-day-title">Mon, Jan 26</div>
-                {timeslot_html}
-            </div>
-        </div>
-        '''
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+        timeslots = _select(_LARGE_TIMESLOT_HTML, _TIMESLOT_CSS, parser_name)
         assert len(timeslots) == 100
+
+
+class TestScraperTimeslotParsing:
+    """Test the scraper's HTML fallback parser on both backends."""
     
-    def test_case_sensitivity_in_attributes(self):
-        """Test that attribute matching is case-sensitive."""
-        html = '''
-        <div data-test="availability-modal-view-container">
-            <a data-test="AVAILABILITY-MODAL-TIMESLOT">9:30 am</a>
-            <a data-test="availability-modal-timeslot">10:00 am</a>
-        </div>
-        '''
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Should only find exact match (case-sensitive)
-        timeslots = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
-        assert len(timeslots) == 1
-        assert timeslots[0].get_text(strip=True) == '10:00 am'
+    @pytest.mark.parametrize("use_lexbor", [
+        pytest.param(True, id="lexbor"),
+        pytest.param(False, id="beautifulsoup"),
+    ])
+    def test_parse_timeslots_backends(self, monkeypatch, sample_modal_html, use_lexbor):
+        """Test timeslots are paired with their day titles by either parser."""
+        if use_lexbor:
+            pytest.importorskip("selectolax")
+        else:
+            monkeypatch.setattr(scraper, 'LexborHTMLParser', None)
+        
+        modal_html = scraper.find_modal_html(sample_modal_html)
+        
+        assert modal_html is not None
+        assert scraper.parse_timeslots(modal_html) == [
+            ('Mon, Jan 26', '9:30 am'),
+            ('Mon, Jan 26', '10:00 am'),
+            ('Mon, Jan 26', '11:30 am'),
+            ('Tue, Jan 27', '2:00 pm'),
+            ('Tue, Jan 27', '3:30 pm'),
+        ]
@@ -3,81 +3,126 @@ Unit tests for proxy configuration and validation.
 Tests proxy settings, authentication, and error handling.
 """
 
+import re
+import logging
 import pytest
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import zocdoc_scraper_production as scraper
+from zocdoc_scraper_production import (
+    PageLoadError, SHUTDOWN, next_proxy, reset_proxy_rotation, retry_with_backoff, worker_proxies
+)
+
+
+# Compiled once: scheme, host, practice ID and LocIdent in a single match
+URL_RE = re.compile(r'^(https?)://([^/?]+)/practice/[^?]*-(\d+)\?(?:.*&)?LocIdent=(\d+)')
+
+# Proxy server: http(s) scheme, host and an explicit port
+PROXY_SERVER_RE = re.compile(r'^https?://[^/:]+:\d+$')
+
+
+# Shared configuration values, declared once for every test in the module;
+# the proxy mapping is read-only so no test can change it for the others
+PROXY_CFG = MappingProxyType({
+    "server": "http://68.225.23.120:13884",
+    "username": "rockin12345678",
+    "password": "Varun123456789"
+})
+URL = "https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976"
+URL_MATCH = URL_RE.match(URL)
+
+
+class FakeScraper:
+    """Stand-in for the scraper instance a retried method is bound to."""
+    
+    def __init__(self):
+        self.metrics = {'retries': 0}
+        self.logger = logging.getLogger('zocdoc_scraper.test')
+    
+    def _count(self, metric):
+        self.metrics[metric] += 1
+
+
+def _flaky_method(failures, error=PageLoadError, **retry_kwargs):
+    """Build a retried method that raises error on its first failures calls."""
+    calls = []
+    
+    @retry_with_backoff(**retry_kwargs)
+    def method(self):
+        calls.append(len(calls))
+        if len(calls) <= failures:
+            raise error("attempt failed")
+        return 'ok'
+    
+    return method, calls
+
+
+@pytest.fixture
+def proxy_pool(monkeypatch):
+    """Fixture installing a three-proxy pool with the rotation at the primary."""
+    pool = tuple(
+        (label, {"server": f"http://10.0.0.{index}:8000", "username": "user", "password": "pass"})
+        for index, label in enumerate(['primary', 'backup_1', 'backup_2'])
+    )
+    monkeypatch.setattr(scraper, 'PROXY_POOL', pool)
+    reset_proxy_rotation()
+    yield pool
+    monkeypatch.undo()
+    reset_proxy_rotation()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Fixture removing retry sleeps and clearing SHUTDOWN around the test."""
+    monkeypatch.setattr(scraper, 'RETRY_MAX_DELAY', 0)
+    SHUTDOWN.clear()
+    yield
+    SHUTDOWN.clear()
 
 
 class TestProxyConfiguration:
     """Test proxy configuration structure and validation."""
     
-    def test_valid_proxy_config(self):
+    @pytest.mark.parametrize("field", ['server', 'username', 'password'])
+    def test_valid_proxy_config(self, field):
         """Test valid proxy configuration."""
-        proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678",
-            "password": "Varun123456789"
-        }
-        
-        assert 'server' in proxy
-        assert 'username' in proxy
-        assert 'password' in proxy
-        assert proxy['server'].startswith('http://')
+        assert field in PROXY_CFG
+        assert isinstance(PROXY_CFG[field], str)
     
-    def test_proxy_disabled(self):
-        """Test proxy configuration when disabled."""
-        USE_PROXY = False
-        proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678",
-            "password": "Varun123456789"
-        } if USE_PROXY else None
-        
-        assert proxy is None
+    def test_proxy_server_scheme(self):
+        """Test configured proxy server uses plain HTTP."""
+        assert PROXY_CFG['server'].startswith('http://')
     
-    def test_proxy_enabled(self):
-        """Test proxy configuration when enabled."""
-        USE_PROXY = True
-        proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678",
-            "password": "Varun123456789"
-        } if USE_PROXY else None
+    @pytest.mark.parametrize("use_proxy", [False, True])
+    def test_proxy_toggle(self, use_proxy):
+        """Test proxy configuration when enabled and disabled."""
+        proxy = PROXY_CFG if use_proxy else None
         
-        assert proxy is not None
-        assert isinstance(proxy, dict)
+        assert (proxy is not None) is use_proxy
+        if use_proxy:
+            assert isinstance(proxy, Mapping)
     
-    def test_proxy_server_format(self):
+    @pytest.mark.parametrize("server", [
+        "http://68.225.23.120:13884",
+        "http://proxy.example.com:8080",
+        "https://secure-proxy.com:443",
+        "http://192.168.1.1:3128"
+    ])
+    def test_proxy_server_format(self, server):
         """Test proxy server URL format validation."""
-        valid_servers = [
-            "http://68.225.23.120:13884",
-            "http://proxy.example.com:8080",
-            "https://secure-proxy.com:443",
-            "http://192.168.1.1:3128"
-        ]
-        
-        for server in valid_servers:
-            assert server.startswith('http://') or server.startswith('https://')
-            assert ':' in server.split('//')[1]  # Has port
+        assert PROXY_SERVER_RE.match(server)  # Scheme and port
     
-    def test_proxy_credentials_not_empty(self):
+    @pytest.mark.parametrize("field", ['username', 'password'])
+    def test_proxy_credentials_not_empty(self, field):
         """Test proxy credentials are not empty."""
-        proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678",
-            "password": "Varun123456789"
-        }
-        
-        assert len(proxy['username']) > 0
-        assert len(proxy['password']) > 0
-        assert proxy['username'].strip() != ''
-        assert proxy['password'].strip() != ''
+        assert len(PROXY_CFG[field]) > 0
+        assert PROXY_CFG[field].strip() != ''
     
     def test_proxy_missing_fields(self):
         """Test detection of missing proxy fields."""
-        incomplete_proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678"
-            # Missing password
-        }
+        incomplete_proxy = dict(PROXY_CFG)
+        del incomplete_proxy['password']  # Missing password
         
         required_fields = ['server', 'username', 'password']
         missing = [field for field in required_fields if field not in incomplete_proxy]
@@ -88,59 +133,29 @@ class TestProxyConfiguration:
     def test_proxy_extra_fields_ignored(self):
         """Test that extra fields in proxy config are ignored."""
         proxy = {
-            "server": "http://68.225.23.120:13884",
-            "username": "rockin12345678",
-            "password": "Varun123456789",
+            **PROXY_CFG,
             "timeout": 30000,  # Extra field
             "retries": 3  # Extra field
         }
         
         # Should still have required fields
-        assert 'server' in proxy
-        assert 'username' in proxy
-        assert 'password' in proxy
+        assert all(field in proxy for field in ('server', 'username', 'password'))
 
 
 class TestURLConfiguration:
     """Test URL configuration and validation."""
     
-    def test_valid_zocdoc_url(self):
-        """Test valid ZocDoc URL format."""
-        url = "https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976"
-        
-        assert url.startswith('https://www.zocdoc.com/')
-        assert 'practice/' in url
-        assert '?' in url
-        assert 'LocIdent=' in url
-    
-    def test_url_has_practice_id(self):
-        """Test URL contains practice ID."""
-        url = "https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976"
-        
-        # Extract practice ID (number before ?)
-        path_part = url.split('?')[0]
-        practice_id = path_part.split('-')[-1]
-        
-        assert practice_id.isdigit()
-        assert practice_id == '19571'
-    
-    def test_url_has_location_identifier(self):
-        """Test URL contains location identifier."""
-        url = "https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976"
-        
-        assert 'LocIdent=' in url
-        
-        # Extract LocIdent value
-        loc_ident = url.split('LocIdent=')[1].split('&')[0]
-        assert loc_ident.isdigit()
-        assert loc_ident == '31976'
-    
-    def test_url_protocol_https(self):
-        """Test URL uses HTTPS protocol."""
-        url = "https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976"
-        
-        assert url.startswith('https://')
-        assert not url.startswith('http://')  # Must be secure
+    # Groups: 1 = scheme (must be secure), 2 = host, 3 = practice ID, 4 = LocIdent
+    @pytest.mark.parametrize("group,expected", [
+        (1, 'https'),
+        (2, 'www.zocdoc.com'),
+        (3, '19571'),
+        (4, '31976'),
+    ])
+    def test_url_component(self, group, expected):
+        """Test ZocDoc URL format and extracted components."""
+        assert URL_MATCH
+        assert URL_MATCH.group(group) == expected
 
 
 class TestRetryLogic:
@@ -186,22 +201,92 @@ class TestRetryLogic:
                 assert should_retry is True
             elif attempt == 2:
                 assert should_retry is False  # Last attempt, don't retry
+    
+    def test_decorator_retries_until_success(self, no_backoff):
+        """Test a method succeeding on its third attempt counts two retries."""
+        method, calls = _flaky_method(2, max_retries=3)
+        owner = FakeScraper()
+        
+        assert method(owner) == 'ok'
+        assert len(calls) == 3
+        assert owner.metrics['retries'] == 2
+    
+    def test_decorator_final_failure_is_not_a_retry(self, no_backoff):
+        """Test the last failed attempt is raised without counting a retry."""
+        method, calls = _flaky_method(5, max_retries=3)
+        owner = FakeScraper()
+        
+        with pytest.raises(PageLoadError):
+            method(owner)
+        assert len(calls) == 3
+        assert owner.metrics['retries'] == 2
+    
+    def test_decorator_ignores_other_errors(self, no_backoff):
+        """Test exceptions outside retry_on are raised on the first failure."""
+        method, calls = _flaky_method(1, error=ValueError, retry_on=(PageLoadError,), max_retries=3)
+        owner = FakeScraper()
+        
+        with pytest.raises(ValueError):
+            method(owner)
+        assert len(calls) == 1
+        assert owner.metrics['retries'] == 0
+    
+    def test_decorator_stops_on_shutdown(self, no_backoff):
+        """Test no further attempt is made once SHUTDOWN is set."""
+        method, calls = _flaky_method(1, max_retries=3)
+        owner = FakeScraper()
+        SHUTDOWN.set()
+        
+        with pytest.raises(PageLoadError):
+            method(owner)
+        assert len(calls) == 1
+        assert owner.metrics['retries'] == 0
 
 
-class TestTimeoutConfiguration:
-    """Test timeout configuration and validation."""
+class TestProxyRotation:
+    """Test failover rotation and the proxies handed to parallel browsers."""
+    
+    def test_rotation_visits_every_proxy(self, proxy_pool):
+        """Test successive failover attempts take each proxy once, primary first."""
+        assert [next_proxy()[0] for _ in proxy_pool] == ['primary', 'backup_1', 'backup_2']
     
-    def test_page_load_timeout_positive(self):
-        """Test page load timeout is positive."""
-        timeout = 60000  # milliseconds
+    def test_reset_restarts_at_primary(self, proxy_pool):
+        """Test a new run starts on the primary proxy wherever the last run stopped."""
+        next_proxy()
+        next_proxy()
+        reset_proxy_rotation()
         
-        assert timeout > 0
-        assert isinstance(timeout, int)
+        assert next_proxy()[0] == 'primary'
+    
+    @pytest.mark.parametrize("label,expected", [
+        ('primary', ['10.0.0.1', '10.0.0.2']),
+        ('backup_2', ['10.0.0.0', '10.0.0.1']),
+    ])
+    def test_worker_proxies_follow_attempt_proxy(self, proxy_pool, label, expected):
+        """Test extra browsers get the proxies after the attempt's, wrapping around."""
+        servers = [proxy['server'] for proxy in worker_proxies(label, 2)]
+        
+        assert servers == [f'http://{host}:8000' for host in expected]
     
-    def test_element_wait_timeout_positive(self):
-        """Test element wait timeout is positive."""
-        timeout = 3000  # milliseconds
+    def test_worker_proxies_leave_rotation_alone(self, proxy_pool):
+        """Test picking worker proxies does not skip proxies in the failover rotation."""
+        first_label, _ = next_proxy()
+        worker_proxies(first_label, 2)
         
+        assert next_proxy()[0] == 'backup_1'
+    
+    def test_worker_proxies_without_proxy(self, proxy_pool):
+        """Test a direct attempt gives every extra browser a direct connection too."""
+        assert worker_proxies('direct', 2) == [None, None]
+
+
+class TestTimeoutConfiguration:
+    """Test timeout configuration and validation."""
+    
+    # Page load and element wait timeouts, in milliseconds
+    @pytest.mark.parametrize("timeout", [60000, 3000])
+    def test_timeout_positive(self, timeout):
+        """Test page load and element wait timeouts are positive."""
         assert timeout > 0
         assert isinstance(timeout, int)
     
@@ -213,13 +298,11 @@ class TestTimeoutConfiguration:
         assert timeout_seconds == 60
         assert isinstance(timeout_seconds, float)
     
-    def test_sleep_duration_reasonable(self):
+    @pytest.mark.parametrize("duration", [1, 2, 3, 4, 5, 10])
+    def test_sleep_duration_reasonable(self, duration):
         """Test sleep durations are reasonable values."""
-        sleep_durations = [1, 2, 3, 4, 5, 10]
-        
-        for duration in sleep_durations:
-            assert 0 < duration <= 10
-            assert isinstance(duration, int)
+        assert 0 < duration <= 10
+        assert isinstance(duration, int)
 
 
 class TestBrowserConfiguration:
@@ -0,0 +1,193 @@
+"""
+Unit tests for the scraper's browser-side runtime helpers.
+Tests resource blocking and storage-state reuse with stand-in Playwright objects,
+and the signal-driven shutdown path.
+"""
+
+import os
+import time
+import signal
+import logging
+import threading
+import pytest
+from types import SimpleNamespace
+
+import zocdoc_scraper_production as scraper
+from zocdoc_scraper_production import (
+    CFG, SHUTDOWN, ZocDocScraper, _block_heavy_resources, _watch_signals, signal_handler
+)
+
+
+# First-party origin of the configured practice page
+SITE = f"https://{scraper._TARGET_NETLOC}"
+
+
+class FakeRoute:
+    """Stand-in for a Playwright route that records how it was handled."""
+    
+    def __init__(self, resource_type, url):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.handled = None
+    
+    def abort(self):
+        self.handled = 'abort'
+    
+    def continue_(self):
+        self.handled = 'continue'
+
+
+def _fake_scraper():
+    """Stand-in for the scraper instance the storage-state methods are bound to."""
+    return SimpleNamespace(
+        logger=logging.getLogger('zocdoc_scraper.test'),
+        _state_lock=threading.Lock(),
+        _state_saved=False
+    )
+
+
+def _fake_page(saves):
+    """Stand-in page whose context writes an empty storage state and records the path."""
+    def storage_state(path):
+        saves.append(path)
+        with open(path, 'w') as f:
+            f.write('{"cookies": [], "origins": []}')
+    
+    return SimpleNamespace(context=SimpleNamespace(storage_state=storage_state))
+
+
+@pytest.fixture
+def clean_shutdown(monkeypatch):
+    """Fixture clearing SHUTDOWN and the recorded signal around the test."""
+    monkeypatch.setattr(scraper, '_shutdown_signal', None)
+    SHUTDOWN.clear()
+    yield
+    SHUTDOWN.clear()
+
+
+@pytest.fixture
+def state_path(tmp_path, monkeypatch):
+    """Fixture pointing STORAGE_STATE_PATH at a temporary file."""
+    path = tmp_path / 'storage_state.json'
+    monkeypatch.setattr(scraper, 'STORAGE_STATE_PATH', path)
+    return path
+
+
+def _route_outcome(resource_type, url):
+    """Run the route handler on one request and return 'abort' or 'continue'."""
+    route = FakeRoute(resource_type, url)
+    _block_heavy_resources(route)
+    return route.handled
+
+
+class TestResourceBlocking:
+    """Test which requests the resource-blocking route handler lets through."""
+    
+    @pytest.mark.parametrize("resource_type", ['image', 'font', 'media'])
+    def test_heavy_resources_aborted(self, resource_type):
+        """Test images, fonts and media are aborted even from the practice site."""
+        assert _route_outcome(resource_type, f"{SITE}/asset") == 'abort'
+    
+    @pytest.mark.parametrize("resource_type", ['document', 'script', 'xhr', 'fetch'])
+    def test_page_resources_continue(self, resource_type):
+        """Test documents, scripts and API calls from the practice site load."""
+        assert _route_outcome(resource_type, f"{SITE}/practice") == 'continue'
+    
+    def test_first_party_stylesheet_continues(self):
+        """Test the practice site's own stylesheets load so the modal renders."""
+        assert _route_outcome('stylesheet', f"{SITE}/styles/main.css") == 'continue'
+    
+    @pytest.mark.parametrize("url", [
+        'https://cdn.example.com/main.css',
+        f"https://{scraper._TARGET_NETLOC}.example.net/main.css",
+        f"https://cdn.example.com/{scraper._TARGET_NETLOC}/main.css",
+    ])
+    def test_third_party_stylesheet_aborted(self, url):
+        """Test stylesheets from any other host are aborted, including lookalike hosts."""
+        assert _route_outcome('stylesheet', url) == 'abort'
+    
+    @pytest.mark.parametrize("url", [
+        'https://www.googletagmanager.com/gtm.js?id=GTM-1',
+        'https://www.google-analytics.com/analytics.js',
+        'https://securepubads.g.doubleclick.net/tag/js/gpt.js',
+        'https://cdn.segment.io/analytics.js/v1/key/analytics.min.js',
+        'https://static.hotjar.com/c/hotjar-1.js',
+        'https://connect.facebook.net/en_US/fbevents.js',
+    ])
+    def test_ad_and_analytics_hosts_aborted(self, url):
+        """Test ad and analytics requests are aborted whatever their resource type."""
+        assert _route_outcome('script', url) == 'abort'
+        assert _route_outcome('xhr', url) == 'abort'
+
+
+
+@pytest.mark.skipif(CFG.storage_state_ttl <= 0, reason="storage state reuse disabled by ZOCDOC_STORAGE_STATE_TTL")
+class TestStorageState:
+    """Test saving and reusing cookies and local storage between browser contexts."""
+    
+    def test_no_state_before_first_save(self, state_path):
+        """Test contexts start clean until a state has been saved."""
+        assert ZocDocScraper._storage_state_path(_fake_scraper()) is None
+    
+    def test_saved_state_is_reused(self, state_path):
+        """Test the saved file is handed to later contexts."""
+        owner = _fake_scraper()
+        ZocDocScraper._save_storage_state(owner, _fake_page([]))
+        
+        assert ZocDocScraper._storage_state_path(owner) == str(state_path)
+    
+    def test_state_saved_once_per_run(self, state_path):
+        """Test only the first good page load of a run snapshots the state."""
+        owner, saves = _fake_scraper(), []
+        ZocDocScraper._save_storage_state(owner, _fake_page(saves))
+        ZocDocScraper._save_storage_state(owner, _fake_page(saves))
+        
+        assert saves == [str(state_path)]
+    
+    def test_stale_state_ignored(self, state_path):
+        """Test a state older than the TTL is not reused."""
+        owner = _fake_scraper()
+        ZocDocScraper._save_storage_state(owner, _fake_page([]))
+        stale = time.time() - CFG.storage_state_ttl - 60
+        os.utime(state_path, (stale, stale))
+        
+        assert ZocDocScraper._storage_state_path(owner) is None
+
+
+
+class TestShutdownSignals:
+    """Test the signal handler and the wakeup-fd watcher that sets SHUTDOWN."""
+    
+    def test_handler_only_records_signal(self, clean_shutdown):
+        """Test the Python-level handler records the signal and leaves SHUTDOWN to the watcher."""
+        signal_handler(signal.SIGTERM, None)
+        
+        assert scraper._shutdown_signal == signal.SIGTERM
+        assert not SHUTDOWN.is_set()
+    
+    def test_watcher_sets_shutdown_on_signal_byte(self, clean_shutdown):
+        """Test a signal number written to the wakeup pipe sets SHUTDOWN and is recorded."""
+        read_fd, write_fd = os.pipe()
+        watcher = threading.Thread(target=_watch_signals, args=(read_fd,), daemon=True)
+        watcher.start()
+        try:
+            os.write(write_fd, bytes([signal.SIGINT]))
+            
+            assert SHUTDOWN.wait(timeout=2)
+            assert scraper._shutdown_signal == signal.SIGINT
+        finally:
+            os.close(write_fd)
+            watcher.join(timeout=2)
+            os.close(read_fd)
+    
+    def test_watcher_exits_when_pipe_closed(self, clean_shutdown):
+        """Test the watcher thread returns once the write end is closed, without setting SHUTDOWN."""
+        read_fd, write_fd = os.pipe()
+        watcher = threading.Thread(target=_watch_signals, args=(read_fd,), daemon=True)
+        watcher.start()
+        
+        os.close(write_fd)
+        watcher.join(timeout=2)
+        os.close(read_fd)
+        
+        assert not watcher.is_alive()
+        assert not SHUTDOWN.is_set()
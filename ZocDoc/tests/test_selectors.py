@@ -5,140 +5,57 @@ Tests selector validation and matching logic.
 
 import pytest
 
-
-class TestModalSelectors:
-    """Test modal dialog selector strategies."""
-    
-    def test_modal_content_selector(self):
-        """Test modal content data-test selector."""
-        selector = '[data-test="modal-content"]'
-        
-        assert selector.startswith('[')
-        assert selector.endswith(']')
-        assert 'data-test' in selector
-        assert 'modal-content' in selector
-    
-    def test_availability_modal_container_selector(self):
-        """Test availability modal container selector."""
-        selector = '[data-test="availability-modal-view-container"]'
-        
-        assert 'data-test' in selector
-        assert 'availability-modal-view-container' in selector
-    
-    def test_role_dialog_selector(self):
-        """Test role=dialog selector."""
-        selector = '[role="dialog"]'
-        
-        assert 'role' in selector
-        assert 'dialog' in selector
+from zocdoc_scraper_production import CFG, SELECTORS, Selectors
+
+
+# (selector, expected prefix, expected substrings) for every single-element locator
+SELECTOR_SHAPES = [
+    pytest.param(SELECTORS.modal_content, '[', ['data-test', 'modal-content'], id='modal_content'),
+    pytest.param(SELECTORS.modal_container, 'div[', ['data-test', 'availability-modal-view-container'], id='modal_container'),
+    pytest.param(SELECTORS.role_dialog, '[', ['role', 'dialog'], id='role_dialog'),
+    pytest.param(SELECTORS.timeslot, 'a[', ['data-test', 'availability-modal-timeslot'], id='timeslot'),
+    pytest.param(SELECTORS.date_wrapper, 'div[', ['availability-modal-content-date-wrapper'], id='date_wrapper'),
+    pytest.param(SELECTORS.day_title, 'div[', ['availability-modal-content-day-title'], id='day_title'),
+    pytest.param(SELECTORS.view_more, 'span:has-text(', ['View more availability'], id='view_more'),
+    pytest.param(SELECTORS.show_more, 'button:has-text(', ['Show more availability'], id='show_more'),
+    pytest.param(SELECTORS.close_btn, 'button[', ['aria-label', 'Close'], id='close_btn'),
+    pytest.param('text="All provider availability"', 'text=', ['All provider availability'], id='all_providers_text'),
+    pytest.param('text="Dr. Michael Ayzin, DDS"', 'text=', ['Dr. Michael Ayzin', 'DDS'], id='doctor_name_text'),
+]
+
+
+class TestSelectorShapes:
+    """Test modal, timeslot, date wrapper, button and dropdown selector strings."""
+    
+    @pytest.mark.parametrize("selector,prefix,contains", SELECTOR_SHAPES)
+    def test_selector_shape(self, selector, prefix, contains):
+        """Test selector targets the expected element and attribute values."""
+        assert selector.startswith(prefix)
+        assert all(part in selector for part in contains)
     
     def test_multiple_modal_selectors(self):
         """Test multiple modal selector combinations."""
         selectors = [
-            '[role="dialog"]',
-            '[data-test="modal-content"]',
-            '[data-test="availability-modal-view-container"]',
+            SELECTORS.role_dialog,
+            SELECTORS.modal_content,
+            SELECTORS.modal_container,
             '[role="dialog"], [data-test*="modal"]'
         ]
         
         for selector in selectors:
             assert len(selector) > 0
             assert '[' in selector or selector.startswith('text=')
-
-
-class TestTimeslotSelectors:
-    """Test appointment timeslot selectors."""
-    
-    def test_timeslot_data_test_selector(self):
-        """Test timeslot data-test attribute selector."""
-        selector = 'a[data-test="availability-modal-timeslot"]'
-        
-        assert selector.startswith('a[')
-        assert 'data-test' in selector
-        assert 'availability-modal-timeslot' in selector
-    
-    def test_timeslot_element_type(self):
-        """Test timeslot selector targets anchor tags."""
-        selector = 'a[data-test="availability-modal-timeslot"]'
-        
-        assert selector.startswith('a')
-
-
-class TestDateWrapperSelectors:
-    """Test date wrapper selectors."""
-    
-    def test_date_wrapper_selector(self):
-        """Test date wrapper data-test selector."""
-        selector = 'div[data-test="availability-modal-content-date-wrapper"]'
-        
-        assert selector.startswith('div[')
-        assert 'availability-modal-content-date-wrapper' in selector
-    
-    def test_day_title_selector(self):
-        """Test day title data-test selector."""
-        selector = 'div[data-test="availability-modal-content-day-title"]'
-        
-        assert selector.startswith('div[')
-        assert 'availability-modal-content-day-title' in selector
-
-
-class TestButtonSelectors:
-    """Test button selectors."""
-    
-    def test_view_more_availability_selector(self):
-        """Test 'View more availability' button selector."""
-        selector = 'span:has-text("View more availability")'
-        
-        assert 'span' in selector
-        assert ':has-text' in selector
-        assert 'View more availability' in selector
-    
-    def test_show_more_availability_selector(self):
-        """Test 'Show more availability' button selector."""
-        selector = 'button:has-text("Show more availability")'
-        
-        assert 'button' in selector
-        assert ':has-text' in selector
-        assert 'Show more availability' in selector
-    
-    def test_close_button_selector(self):
-        """Test close button selector."""
-        selector = 'button[aria-label="Close"]'
-        
-        assert 'button' in selector
-        assert 'aria-label' in selector
-        assert 'Close' in selector
-
-
-class TestDropdownSelectors:
-    """Test provider dropdown selectors."""
-    
-    def test_all_provider_availability_selector(self):
-        """Test 'All provider availability' text selector."""
-        selector = 'text="All provider availability"'
-        
-        assert selector.startswith('text=')
-        assert 'All provider availability' in selector
-    
-    def test_doctor_name_selector(self):
-        """Test doctor name text selector."""
-        selector = 'text="Dr. Michael Ayzin, DDS"'
-        
-        assert selector.startswith('text=')
-        assert 'Dr. Michael Ayzin' in selector
-        assert 'DDS' in selector
     
     def test_dropdown_control_selectors(self):
         """Test various dropdown control selectors."""
-        selectors = [
-            '.css-nm0j11-control',
-            '.css-eio9xs-control',
-            'div[class*="control"]:has-text("provider")',
-            'div[class*="control"]:has-text("All provider")'
-        ]
+        selectors = SELECTORS.dropdown_controls
         
+        assert len(selectors) == 4
         for selector in selectors:
             assert len(selector) > 0
+        
+        # Joined once for the single locator call in the scraper
+        assert SELECTORS.dropdown_any.split(', ') == list(selectors)
 
 
 class TestSelectorCombinations:
@@ -157,8 +74,7 @@ class TestSelectorCombinations:
         """Test wildcard attribute selector."""
         selector = '[data-test*="modal"]'
         
-        assert 'data-test*=' in selector
-        assert '*=' in selector  # Contains operator
+        assert all(part in selector for part in ('data-test*=', '*='))  # Contains operator
     
     def test_combined_selector_with_or(self):
         """Test combined selectors with OR operator."""
@@ -167,8 +83,19 @@ class TestSelectorCombinations:
         assert ',' in selector
         parts = selector.split(',')
         assert len(parts) == 2
-        assert '[role="dialog"]' in parts[0]
-        assert '[data-test*="modal"]' in parts[1].strip()
+        assert all(expected in part for expected, part in zip(('[role="dialog"]', '[data-test*="modal"]'), parts))
+    
+    def test_combined_modal_selector(self):
+        """Test the scraper's combined modal selector splits back into its fallbacks."""
+        parts = [part.strip() for part in SELECTORS.modal_any.split(',')]
+        
+        assert parts == [SELECTORS.modal_container, SELECTORS.modal_content]
+    
+    def test_combined_provider_option_selector(self):
+        """Test the selector waited on after opening the dropdown covers both option markups."""
+        parts = [part.strip() for part in SELECTORS.provider_option_any.split(',')]
+        
+        assert parts == [SELECTORS.provider_option_role, SELECTORS.provider_option]
 
 
 class TestLocatorMethods:
@@ -205,9 +132,34 @@ class TestLocatorMethods:
         assert locator_config['method'] == 'count'
 
 
+class TestDoctorEntries:
+    """Test precomputed per-doctor lookup strings."""
+    
+    def test_one_entry_per_target_doctor(self):
+        """Test every target doctor has an entry, in order."""
+        assert len(CFG.doctor_entries) == len(CFG.target_doctors)
+        assert [entry.name for entry in CFG.doctor_entries] == list(CFG.target_doctors)
+    
+    @pytest.mark.parametrize("entry", CFG.doctor_entries, ids=lambda entry: entry.key)
+    def test_entry_lookup_strings(self, entry):
+        """Test short name, text selector and key derived from the full name."""
+        assert entry.name.startswith(entry.short_name)
+        assert ',' not in entry.short_name
+        assert entry.text_selector == f'div:has-text("{entry.name}")'
+        assert entry.key.replace('_', '').isalnum()
+        assert entry.key == entry.key.lower()
+
+
 class TestSelectorEdgeCases:
     """Test edge cases in selector usage."""
     
+    def test_selectors_are_frozen(self):
+        """Test the shared selector table cannot be modified at runtime."""
+        with pytest.raises(AttributeError):
+            SELECTORS.timeslot = 'a'
+        
+        assert Selectors() == SELECTORS
+    
     def test_empty_selector(self):
         """Test handling of empty selector."""
         selector = ''
@@ -220,15 +172,13 @@ class TestSelectorEdgeCases:
         double_quote_selector = 'text="View more availability"'
         single_quote_selector = "text='View more availability'"
         
-        assert 'View more availability' in double_quote_selector
-        assert 'View more availability' in single_quote_selector
+        assert all('View more availability' in selector for selector in (double_quote_selector, single_quote_selector))
     
     def test_selector_with_special_characters(self):
         """Test selector with special characters."""
         selector = 'div[aria-label="Close dialog"]'
         
-        assert '-' in selector  # Hyphen in attribute name
-        assert ' ' in selector  # Space in attribute value
+        assert all(char in selector for char in ('-', ' '))  # Hyphen in attribute name, space in value
     
     def test_case_sensitive_selector(self):
         """Test case sensitivity in selectors."""
@@ -253,7 +203,9 @@ class TestSelectorEdgeCases:
         starts_with = '[data-test^="modal"]'  # Starts with
         ends_with = '[data-test$="content"]'  # Ends with
         
-        assert '=' in exact_match
-        assert '*=' in contains
-        assert '^=' in starts_with
-        assert '$=' in ends_with
+        assert all(operator in selector for operator, selector in (
+            ('=', exact_match),
+            ('*=', contains),
+            ('^=', starts_with),
+            ('$=', ends_with),
+        ))
@@ -14,127 +14,401 @@ Features:
 - Environment-based configuration
 """
 
+import csv
 import os
+import queue
+import json
+import re
+import random
+import functools
+import itertools
 import sys
 import time
 import logging
-import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from logging.handlers import RotatingFileHandler
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, List, Dict, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
+from logging.handlers import TimedRotatingFileHandler
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
-from camoufox.sync_api import Camoufox
-from bs4 import BeautifulSoup
-import pandas as pd
+# Heavy third-party modules (camoufox, bs4, pyarrow) are imported where
+# they are used, so importing this module for its selectors or validation
+# helpers does not load a browser driver or a dataframe library
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional C parser; BeautifulSoup is used without it
+    LexborHTMLParser = None
 
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
+def _env_flag(name: str, default: str) -> bool:
+    """Read a 'true'/'false' environment variable."""
+    return os.getenv(name, default).lower() == 'true'
+
+
+class DoctorEntry(NamedTuple):
+    """Target doctor with the lookup strings derived from the name."""
+    
+    name: str  # "Dr. Michael Ayzin, DDS"
+    short_name: str  # "Dr. Michael Ayzin", as shown in the provider dropdown
+    text_selector: str  # Playwright selector for any div showing the full name
+    key: str  # "dr_michael_ayzin_dds", safe for file names
+
+
+def _doctor_entry(name: str) -> DoctorEntry:
+    """Derive a DoctorEntry from a full doctor name."""
+    key = name.lower().replace(',', '').replace('.', '').replace(' ', '_')
+    return DoctorEntry(
+        name=sys.intern(name),
+        short_name=sys.intern(name.split(',')[0]),
+        text_selector=f'div:has-text("{name}")',
+        key=sys.intern(key)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Production configuration with environment variable support."""
     
     # Proxy settings
-    PROXY_ENABLED = os.getenv('ZOCDOC_PROXY_ENABLED', 'true').lower() == 'true'
-    PROXY_SERVER = os.getenv('ZOCDOC_PROXY_SERVER', 'http://68.225.23.120:13884')
-    PROXY_USERNAME = os.getenv('ZOCDOC_PROXY_USERNAME', 'rockin12345678')
-    PROXY_PASSWORD = os.getenv('ZOCDOC_PROXY_PASSWORD', 'Varun123456789')
+    proxy_enabled: bool
+    proxy_server: str
+    proxy_username: str
+    proxy_password: str
     
-    # Backup proxy list from environment variable (format: ip:port:username:password, comma-separated)
-    _backup_proxies_env = os.getenv('ZOCDOC_BACKUP_PROXIES', '')
-    PROXY_BACKUP_LIST = [p.strip() for p in _backup_proxies_env.split(',') if p.strip()] if _backup_proxies_env else []
+    # Backup proxies, each formatted ip:port:username:password
+    proxy_backup_list: Tuple[str, ...]
     
     # Scraping settings
-    TARGET_URL = os.getenv('ZOCDOC_URL', 'https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976')
+    target_url: str
+    target_doctors: Tuple[str, ...]
+    doctor_entries: Tuple[DoctorEntry, ...]  # Derived from target_doctors
     
-    # Multiple doctors to scrape
-    TARGET_DOCTORS = [
-        'Dr. Michael Ayzin, DDS',
-        'Dr. Ronald Ayzin, DDS'
-    ]
+    # Concurrent browsers, one doctor each; 1 scrapes doctors sequentially in one browser
+    max_workers: int
     
     # Retry settings
-    MAX_RETRIES = int(os.getenv('ZOCDOC_MAX_RETRIES', '3'))
-    RETRY_DELAY = int(os.getenv('ZOCDOC_RETRY_DELAY', '5'))
+    max_retries: int
+    retry_delay: int
     
     # Timeout settings (milliseconds)
-    PAGE_LOAD_TIMEOUT = int(os.getenv('ZOCDOC_PAGE_TIMEOUT', '60000'))
-    ELEMENT_TIMEOUT = int(os.getenv('ZOCDOC_ELEMENT_TIMEOUT', '5000'))
+    page_load_timeout: int
+    element_timeout: int
     
     # Browser settings
-    HEADLESS = os.getenv('ZOCDOC_HEADLESS', 'false').lower() == 'true'
-    HUMANIZE = os.getenv('ZOCDOC_HUMANIZE', 'true').lower() == 'true'
-    GEOIP = os.getenv('ZOCDOC_GEOIP', 'true').lower() == 'true'
+    headless: bool
+    humanize: bool
+    geoip: bool
+    block_resources: bool  # Abort image/font/media/third-party stylesheet/analytics requests
+    debug_full_page: bool  # Full-page debug screenshots instead of the viewport only
+    storage_state_ttl: int  # Seconds a saved cookie/storage snapshot is reused; 0 disables it
     
     # Output settings
-    OUTPUT_DIR = Path(os.getenv('ZOCDOC_OUTPUT_DIR', './output'))
-    LOG_DIR = Path(os.getenv('ZOCDOC_LOG_DIR', './logs'))
+    output_dir: Path
+    output_format: str  # 'parquet' or 'csv'
+    log_dir: Path
     
     # Logging settings
-    LOG_LEVEL = os.getenv('ZOCDOC_LOG_LEVEL', 'INFO')
-    LOG_MAX_BYTES = int(os.getenv('ZOCDOC_LOG_MAX_BYTES', '10485760'))  # 10MB
-    LOG_BACKUP_COUNT = int(os.getenv('ZOCDOC_LOG_BACKUP_COUNT', '5'))
+    log_level: str
+    log_backup_count: int
+    
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """
+        Parse all ZOCDOC_* environment variables into a Config.
+        
+        Returns:
+            Config populated from the environment, with defaults for unset values
+        """
+        # Backup proxy list (comma-separated)
+        backup_proxies = os.getenv('ZOCDOC_BACKUP_PROXIES', '')
+        
+        target_doctors = (
+            'Dr. Michael Ayzin, DDS',
+            'Dr. Ronald Ayzin, DDS'
+        )
+        
+        return cls(
+            proxy_enabled=_env_flag('ZOCDOC_PROXY_ENABLED', 'true'),
+            proxy_server=os.getenv('ZOCDOC_PROXY_SERVER', 'http://68.225.23.120:13884'),
+            proxy_username=os.getenv('ZOCDOC_PROXY_USERNAME', 'rockin12345678'),
+            proxy_password=os.getenv('ZOCDOC_PROXY_PASSWORD', 'Varun123456789'),
+            proxy_backup_list=tuple(p.strip() for p in backup_proxies.split(',') if p.strip()),
+            target_url=os.getenv('ZOCDOC_URL', 'https://www.zocdoc.com/practice/dentistry-at-its-finest-19571?LocIdent=31976'),
+            target_doctors=target_doctors,
+            doctor_entries=tuple(_doctor_entry(name) for name in target_doctors),
+            max_workers=max(1, int(os.getenv('ZOCDOC_MAX_WORKERS', '1'))),
+            max_retries=int(os.getenv('ZOCDOC_MAX_RETRIES', '3')),
+            retry_delay=int(os.getenv('ZOCDOC_RETRY_DELAY', '5')),
+            page_load_timeout=int(os.getenv('ZOCDOC_PAGE_TIMEOUT', '60000')),
+            element_timeout=int(os.getenv('ZOCDOC_ELEMENT_TIMEOUT', '5000')),
+            headless=_env_flag('ZOCDOC_HEADLESS', 'false'),
+            humanize=_env_flag('ZOCDOC_HUMANIZE', 'true'),
+            geoip=_env_flag('ZOCDOC_GEOIP', 'true'),
+            block_resources=_env_flag('ZOCDOC_BLOCK_RESOURCES', 'false'),
+            debug_full_page=_env_flag('ZOCDOC_DEBUG_FULL_PAGE', 'false'),
+            storage_state_ttl=int(os.getenv('ZOCDOC_STORAGE_STATE_TTL', '3600')),
+            output_dir=Path(os.getenv('ZOCDOC_OUTPUT_DIR', './output')),
+            output_format=os.getenv('ZOCDOC_OUTPUT_FORMAT', 'parquet').lower(),
+            log_dir=Path(os.getenv('ZOCDOC_LOG_DIR', './logs')),
+            log_level=os.getenv('ZOCDOC_LOG_LEVEL', 'INFO'),
+            log_backup_count=int(os.getenv('ZOCDOC_LOG_BACKUP_COUNT', '5')),
+        )
+
+
+# Parsed once at import and shared read-only by every scraper and worker thread
+CFG = Config.from_env()
+
+# Cookies and local storage of the last good page load, shared by later browser contexts
+STORAGE_STATE_PATH = CFG.output_dir / 'storage_state.json'
+
+
+def _build_proxy_pool(cfg: Config) -> Tuple[Tuple[str, Dict[str, str]], ...]:
+    """
+    Parse the primary and backup proxies into labelled Camoufox proxy dicts.
+    
+    Args:
+        cfg: Parsed configuration
+        
+    Returns:
+        Tuple of (label, proxy) pairs, primary first; empty when proxies are
+        disabled. Backup entries not in ip:port:username:password form are skipped.
+    """
+    if not cfg.proxy_enabled:
+        return ()
+    
+    pool = [('primary', {
+        "server": cfg.proxy_server,
+        "username": cfg.proxy_username,
+        "password": cfg.proxy_password
+    })]
+    for index, proxy_str in enumerate(cfg.proxy_backup_list):
+        parts = proxy_str.split(':')
+        if len(parts) == 4:
+            ip, port, username, password = parts
+            pool.append((f"backup_{index + 1}", {
+                "server": f"http://{ip}:{port}",
+                "username": username,
+                "password": password
+            }))
+    return tuple(pool)
+
+
+PROXY_POOL = _build_proxy_pool(CFG)
+
+# Every run restarts the rotation at the primary proxy (see reset_proxy_rotation)
+_proxy_cycle = itertools.cycle(PROXY_POOL)
+_proxy_lock = threading.Lock()
+
+
+def reset_proxy_rotation() -> None:
+    """Restart the proxy rotation so the next proxy taken is the primary."""
+    global _proxy_cycle
+    with _proxy_lock:
+        _proxy_cycle = itertools.cycle(PROXY_POOL)
+
+
+def next_proxy() -> Tuple[str, Optional[Dict[str, str]]]:
+    """
+    Take the next proxy in the rotation.
+    
+    Returns:
+        (label, proxy) pair; ('direct', None) when proxies are disabled
+    """
+    if not PROXY_POOL:
+        return 'direct', None
+    with _proxy_lock:
+        label, proxy = next(_proxy_cycle)
+    # Copy so a caller mutating the dict cannot change the shared pool
+    return label, dict(proxy)
+
+
+def worker_proxies(label: str, count: int) -> List[Optional[Dict[str, str]]]:
+    """
+    Pick proxies for extra parallel browsers without advancing the rotation.
+    
+    Args:
+        label: Label of the proxy the current attempt uses
+        count: Number of extra browsers
+        
+    Returns:
+        The count proxies following label in PROXY_POOL, wrapping around;
+        all None when the attempt runs without a proxy
+    """
+    labels = [entry_label for entry_label, _ in PROXY_POOL]
+    if label not in labels:
+        return [None] * count
+    start = labels.index(label) + 1
+    return [dict(PROXY_POOL[(start + i) % len(PROXY_POOL)][1]) for i in range(count)]
+
+
+# ============================================================================
+# SELECTORS
+# ============================================================================
+
+@dataclass(frozen=True)
+class Selectors:
+    """Canonical CSS/Playwright selectors for the ZocDoc practice page."""
+    
+    # Availability modal
+    modal_content: str = '[data-test="modal-content"]'
+    modal_container: str = 'div[data-test="availability-modal-view-container"]'
+    role_dialog: str = '[role="dialog"]'
+    timeslot: str = 'a[data-test="availability-modal-timeslot"]'
+    date_wrapper: str = 'div[data-test="availability-modal-content-date-wrapper"]'
+    day_title: str = 'div[data-test="availability-modal-content-day-title"]'
+    
+    # Buttons
+    view_more: str = 'span:has-text("View more availability")'
+    show_more: str = 'button:has-text("Show more availability")'
+    close_btn: str = 'button[aria-label="Close"]'
+    
+    # Provider dropdown
+    dropdown_controls: Tuple[str, ...] = (
+        '.css-nm0j11-control',
+        '.css-eio9xs-control',
+        'div[class*="control"]:has-text("provider")',
+        'div[class*="control"]:has-text("All provider")',
+    )
+    provider_option_role: str = '[role="option"]'
+    provider_option: str = '[data-test="provider-option"]'
+    
+    # Derived once from the fields above
+    modal_any: str = field(init=False)
+    dropdown_any: str = field(init=False)
+    provider_option_any: str = field(init=False)
+    
+    def __post_init__(self):
+        # One selector list means one tree traversal instead of one per fallback
+        object.__setattr__(self, 'modal_any', ', '.join((self.modal_container, self.modal_content)))
+        object.__setattr__(self, 'dropdown_any', ', '.join(self.dropdown_controls))
+        object.__setattr__(self, 'provider_option_any', ', '.join((self.provider_option_role, self.provider_option)))
+
+
+# Built once at import; locator calls reference these attributes instead of literals
+SELECTORS = Selectors()
+
+# Reads every timeslot of the open modal in one browser round-trip. Returns null
+# when neither the modal nor any timeslot is on the page.
+_TIMESLOT_BULK_JS = """
+([modalSel, slotSel, wrapperSel, titleSel]) => {
+    const root = document.querySelector(modalSel)
+        || (document.querySelector(slotSel) ? document : null);
+    if (!root) return null;
+    return Array.from(root.querySelectorAll(slotSel), a => {
+        const title = a.closest(wrapperSel)?.querySelector(titleSel);
+        const date = title ? title.textContent.trim() : 'Unknown Date';
+        const time = a.textContent.trim();
+        return {date, time, datetime: `${date} ${time}`};
+    });
+}
+"""
+
+# The extractor above specialized to SELECTORS and installed on every scraper page
+# with add_init_script. The selectors are baked in as literals, so each read
+# sends and compiles only the short call expression below. One variant serves
+# every doctor: the page-side code never uses the doctor name, which is
+# attached to each row in Python.
+_TIMESLOT_INIT_JS = """
+(() => {
+    const extract = %s;
+    const selectors = %s;
+    window.__zocdocTimeslots = () => extract(selectors);
+})();
+""" % (
+    _TIMESLOT_BULK_JS.strip(),
+    json.dumps([SELECTORS.modal_any, SELECTORS.timeslot, SELECTORS.date_wrapper, SELECTORS.day_title])
+)
+_TIMESLOT_CALL_JS = "() => window.__zocdocTimeslots()"
+
+# Outer HTML of the first element matching a selector, or null
+_MODAL_HTML_JS = "sel => document.querySelector(sel)?.outerHTML ?? null"
+
+# Soft-block check run in the page, so only a boolean crosses the wire
+_RESTRICTED_JS = """
+() => {
+    const html = document.documentElement.outerHTML;
+    return html.includes('403') && html.toLowerCase().includes('restricted');
+}
+"""
 
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
+# Formatters are built once and shared by every handler
+_CONSOLE_FMT = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_FILE_FMT = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+# Looked up once; setup_logging and main use this object directly
+_LOGGER = logging.getLogger('zocdoc_scraper')
+
+
 def setup_logging() -> logging.Logger:
     """
     Configure production-grade logging with rotation and structured output.
     
+    Log files are opened on their first record, so a run that never logs an
+    error never creates or opens the error log.
+    
     Returns:
         Configured logger instance
     """
-    # Create log directory
-    Config.LOG_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Create logger
-    logger = logging.getLogger('zocdoc_scraper')
-    logger.setLevel(getattr(logging, Config.LOG_LEVEL.upper()))
+    logger = _LOGGER
     
-    # Prevent duplicate handlers
+    # Already configured - reuse existing handlers
     if logger.handlers:
         return logger
     
+    # Create log directory
+    CFG.log_dir.mkdir(parents=True, exist_ok=True)
+    logger.setLevel(getattr(logging, CFG.log_level.upper()))
+    
     # Console handler with color-coded output
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(console_format)
-    
-    # File handler with rotation
-    log_file = Config.LOG_DIR / f'zocdoc_scraper_{datetime.now():%Y%m%d}.log'
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=Config.LOG_MAX_BYTES,
-        backupCount=Config.LOG_BACKUP_COUNT,
-        encoding='utf-8'
+    console_handler.setFormatter(_CONSOLE_FMT)
+    
+    # File handler, rotated daily at midnight (old files get a date suffix)
+    file_handler = TimedRotatingFileHandler(
+        CFG.log_dir / 'zocdoc_scraper.log',
+        when='midnight',
+        backupCount=CFG.log_backup_count,
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_format)
+    file_handler.setFormatter(_FILE_FMT)
     
     # Error file handler for ERROR and CRITICAL only
-    error_log_file = Config.LOG_DIR / f'zocdoc_errors_{datetime.now():%Y%m%d}.log'
-    error_handler = RotatingFileHandler(
-        error_log_file,
-        maxBytes=Config.LOG_MAX_BYTES,
-        backupCount=Config.LOG_BACKUP_COUNT,
-        encoding='utf-8'
+    error_handler = TimedRotatingFileHandler(
+        CFG.log_dir / 'zocdoc_errors.log',
+        when='midnight',
+        backupCount=CFG.log_backup_count,
+        encoding='utf-8',
+        delay=True
     )
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(file_format)
+    error_handler.setFormatter(_FILE_FMT)
     
     # Add handlers
     logger.addHandler(console_handler)
@@ -150,38 +424,326 @@ def setup_logging() -> logging.Logger:
 
 class ZocDocScraperError(Exception):
     """Base exception for ZocDoc scraper."""
-    pass
+    __slots__ = ()
 
 
 class ProxyConnectionError(ZocDocScraperError):
     """Raised when proxy connection fails."""
-    pass
+    __slots__ = ()
 
 
 class PageLoadError(ZocDocScraperError):
     """Raised when page fails to load."""
-    pass
+    __slots__ = ()
 
 
 class DoctorSelectionError(ZocDocScraperError):
     """Raised when doctor cannot be selected."""
-    pass
+    __slots__ = ()
 
 
 class ModalNotFoundError(ZocDocScraperError):
     """Raised when modal dialog cannot be found."""
-    pass
+    __slots__ = ()
 
 
 class DataExtractionError(ZocDocScraperError):
     """Raised when data extraction fails."""
-    pass
+    __slots__ = ()
+
+
+# ============================================================================
+# DATA VALIDATION
+# ============================================================================
+
+# Column order of every appointment record and of the CSV output
+APPOINTMENT_COLUMNS = ['doctor', 'date', 'time', 'datetime', 'scraped_at']
+
+# Compiled once at import; Python matches single values with them and
+# validate_appointments hands their .pattern source to Arrow's RE2 engine
+TIME_PATTERN = re.compile(r'^\d{1,2}:\d{2} [ap]m$', re.IGNORECASE)
+DOCTOR_PATTERN = re.compile(r'^Dr\..+,')
+
+
+def validate_appointments(table: "pa.Table") -> "pa.ChunkedArray":
+    """
+    Check appointment rows for well-formed values.
+    
+    All checks run as vectorized Arrow compute kernels over whole columns
+    rather than a Python loop per row.
+    
+    Args:
+        table: Arrow table with doctor, date and time columns
+        
+    Returns:
+        Boolean array, True for rows that pass every check
+    """
+    import pyarrow.compute as pc
+    
+    doctor, date, time_ = (table.column(name) for name in ('doctor', 'date', 'time'))
+    
+    valid = pc.and_(
+        pc.match_substring_regex(time_, TIME_PATTERN.pattern, ignore_case=True),
+        pc.match_substring_regex(doctor, DOCTOR_PATTERN.pattern)
+    )
+    for column in (doctor, date, time_):
+        valid = pc.and_(valid, pc.greater(pc.utf8_length(pc.utf8_trim_whitespace(column)), 0))
+    
+    return valid.fill_null(False)
+
+
+# ============================================================================
+# HTML PARSING
+# ============================================================================
+
+def find_modal_html(page_html: str) -> Optional[str]:
+    """
+    Locate the availability modal in a full page.
+    
+    Args:
+        page_html: Full page HTML
+        
+    Returns:
+        Outer HTML of the modal container, or None if it is not on the page
+    """
+    if LexborHTMLParser is not None:
+        modal = LexborHTMLParser(page_html).css_first(SELECTORS.modal_any)
+        return modal.html if modal is not None else None
+    
+    from bs4 import BeautifulSoup
+    
+    modal = BeautifulSoup(page_html, 'lxml').select_one(SELECTORS.modal_any)
+    return str(modal) if modal is not None else None
+
+
+def parse_timeslots(modal_html: str) -> List[Tuple[Optional[str], str]]:
+    """
+    Pair every timeslot in the modal with the title of its date wrapper.
+    
+    Uses selectolax's lexbor parser when installed, BeautifulSoup on lxml otherwise.
+    
+    Args:
+        modal_html: Modal HTML content
+        
+    Returns:
+        List of (day_title, time_text) tuples; day_title is None when the
+        timeslot has no date wrapper or the wrapper has no title
+    """
+    timeslots = []
+    
+    if LexborHTMLParser is not None:
+        for node in LexborHTMLParser(modal_html).css(SELECTORS.timeslot):
+            day_title = None
+            wrapper = node.parent
+            while wrapper is not None and wrapper.is_element_node:
+                if wrapper.attributes.get('data-test') == 'availability-modal-content-date-wrapper':
+                    title = wrapper.css_first(SELECTORS.day_title)
+                    day_title = title.text(strip=True) if title is not None else None
+                    break
+                wrapper = wrapper.parent
+            timeslots.append((day_title, node.text(strip=True)))
+        return timeslots
+    
+    from bs4 import BeautifulSoup
+    
+    for node in BeautifulSoup(modal_html, 'lxml').select(SELECTORS.timeslot):
+        day_title = None
+        wrapper = node.find_parent('div', {'data-test': 'availability-modal-content-date-wrapper'})
+        if wrapper:
+            title = wrapper.select_one(SELECTORS.day_title)
+            day_title = title.get_text(strip=True) if title else None
+        timeslots.append((day_title, node.get_text(strip=True)))
+    return timeslots
+
+
+# ============================================================================
+# RETRY
+# ============================================================================
+
+# Set by the signal handler; the scraper stops at the next safe point between
+# modals or doctors and still saves what it collected. Backoff sleeps end early.
+SHUTDOWN = threading.Event()
+
+RETRY_MAX_DELAY = 30.0  # Upper bound on a single backoff sleep before jitter, in seconds
+
+# Failures worth another attempt: the page or proxy may recover on its own
+TRANSIENT_ERRORS = (PageLoadError, ProxyConnectionError, TimeoutError)
+
+
+def retry_with_backoff(retry_on: Tuple[type, ...] = TRANSIENT_ERRORS, max_retries: Optional[int] = None):
+    """
+    Retry a scraper method with exponential backoff and jitter.
+    
+    Delays grow as CFG.retry_delay * 2**attempt, capped at RETRY_MAX_DELAY,
+    then scaled by a random factor between 0.5 and 1.5 so parallel workers
+    hitting the same failure do not retry in lockstep. Exceptions outside
+    retry_on are raised on the first failure.
+    
+    Args:
+        retry_on: Exception types that trigger another attempt
+        max_retries: Total attempts; defaults to CFG.max_retries
+        
+    Returns:
+        Decorator for a ZocDocScraper method; the wrapped method raises the
+        last exception once every attempt has failed
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            attempts = max(1, CFG.max_retries if max_retries is None else max_retries)
+            
+            for attempt in range(attempts):
+                try:
+                    return method(self, *args, **kwargs)
+                except retry_on as e:
+                    if attempt == attempts - 1 or SHUTDOWN.is_set():
+                        self.logger.error("All %s attempts failed. Last error: %s", attempts, e)
+                        raise
+                    
+                    self._count('retries')
+                    delay = min(RETRY_MAX_DELAY, CFG.retry_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                    self.logger.warning(
+                        "Attempt %s/%s failed: %s. Retrying in %.1f seconds...",
+                        attempt + 1, attempts, e, delay
+                    )
+                    if SHUTDOWN.wait(delay):
+                        raise
+        
+        return wrapper
+    
+    return decorator
+
+
+# ============================================================================
+# RESOURCE BLOCKING
+# ============================================================================
+
+# Requests that carry no DOM or script state the scraper needs
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+# Ad and analytics hosts, blocked whatever the resource type
+BLOCKED_URL_PARTS = (
+    'doubleclick',
+    'googletagmanager',
+    'google-analytics',
+    'googleanalytics',
+    'segment.io',
+    'hotjar',
+    'facebook.net',
+)
+
+# Stylesheets from the practice site itself still load so the modal renders
+_TARGET_NETLOC = urlsplit(CFG.target_url).netloc
+
+
+def _block_heavy_resources(route) -> None:
+    """
+    Playwright route handler that aborts images, fonts, media, third-party
+    stylesheets and ad/analytics requests and lets everything else through.
+    
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    resource_type = request.resource_type
+    url = request.url
+    
+    if resource_type in BLOCKED_RESOURCE_TYPES and not (
+        resource_type == 'stylesheet' and urlsplit(url).netloc == _TARGET_NETLOC
+    ):
+        route.abort()
+    elif any(part in url for part in BLOCKED_URL_PARTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+# ============================================================================
+# RESULTS OUTPUT
+# ============================================================================
+
+def appointments_table(appointments: List[Dict]) -> "pa.Table":
+    """
+    Build an Arrow table of appointment records in APPOINTMENT_COLUMNS order.
+    
+    Args:
+        appointments: Appointment records; missing keys become nulls
+        
+    Returns:
+        Table with one string column per APPOINTMENT_COLUMNS entry
+    """
+    import pyarrow as pa
+    
+    schema = pa.schema([(column, pa.string()) for column in APPOINTMENT_COLUMNS])
+    return pa.Table.from_pylist(appointments, schema=schema)
+
+
+class RawAppointmentWriter:
+    """
+    Append-only raw appointments file, written as each doctor's batch arrives.
+    
+    Rows reach disk while the run is still going, so a crash or a failed proxy
+    attempt keeps everything scraped so far. CSV rows are flushed per batch;
+    Parquet batches become row groups of one file, finalized by close().
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Target file; a .csv suffix selects CSV, anything else Parquet
+        """
+        self.path = path
+        self.rows = 0
+        self._file = None
+        self._writer = None
+    
+    def write(self, appointments: List[Dict]) -> None:
+        """
+        Append one batch of appointments, opening the file on first use.
+        
+        Args:
+            appointments: Appointment records keyed by APPOINTMENT_COLUMNS
+        """
+        if not appointments:
+            return
+        
+        if self.path.suffix == '.csv':
+            if self._writer is None:
+                self._file = open(self.path, 'w', newline='', encoding='utf-8')
+                self._writer = csv.DictWriter(
+                    self._file, fieldnames=APPOINTMENT_COLUMNS, extrasaction='ignore', lineterminator='\n'
+                )
+                self._writer.writeheader()
+            self._writer.writerows(appointments)
+            self._file.flush()
+        else:
+            import pyarrow.parquet as pq
+            
+            table = appointments_table(appointments)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+            self._writer.write_table(table)
+        
+        self.rows += len(appointments)
+    
+    def close(self) -> None:
+        """Finish the file; safe to call more than once."""
+        if self._writer is None:
+            return
+        
+        if self._file is not None:
+            self._file.close()
+        else:
+            self._writer.close()
+        self._file = None
+        self._writer = None
 
 
 # ============================================================================
 # SCRAPER CLASS
 # ============================================================================
 
+
 class ZocDocScraper:
     """Production-grade ZocDoc appointment scraper."""
     
@@ -195,7 +757,14 @@ class ZocDocScraper:
         self.logger = logger
         self.start_time = None
         self.appointments: List[Dict] = []
-        self.current_doctor = None  # Track current doctor being processed
+        self._seen: set = set()  # (doctor, date, time) keys already in self.appointments
+        self._local = threading.local()  # Current doctor is tracked per worker thread
+        self._metrics_lock = threading.Lock()
+        self._artifact_queue: queue.Queue = queue.Queue()  # (path, bytes or str) pairs
+        self._artifact_thread: Optional[threading.Thread] = None  # Running only inside run()
+        self._state_lock = threading.Lock()
+        self._state_saved = False  # Storage state is snapshotted once per run
+        self._parallel = CFG.max_workers > 1 and len(CFG.target_doctors) > 1
         self.metrics = {
             'page_loads': 0,
             'retries': 0,
@@ -204,91 +773,92 @@ class ZocDocScraper:
         }
         
         # Ensure output directory exists
-        Config.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        CFG.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Every scraped row, duplicates included, is streamed here as it arrives
+        self._stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        extension = 'csv' if CFG.output_format == 'csv' else 'parquet'
+        self._raw_writer = RawAppointmentWriter(CFG.output_dir / f'appointments_raw_{self._stamp}.{extension}')
         
         self.logger.info("=" * 80)
         self.logger.info("ZocDoc Scraper - Production Version")
         self.logger.info("=" * 80)
-        self.logger.info(f"Target URL: {Config.TARGET_URL}")
-        self.logger.info(f"Target Doctors: {', '.join(Config.TARGET_DOCTORS)}")
-        self.logger.info(f"Proxy Enabled: {Config.PROXY_ENABLED}")
-        self.logger.info(f"Headless Mode: {Config.HEADLESS}")
+        self.logger.info("Target URL: %s", CFG.target_url)
+        self.logger.info("Target Doctors: %s", ', '.join(CFG.target_doctors))
+        self.logger.info("Proxy Enabled: %s", CFG.proxy_enabled)
+        self.logger.info("Headless Mode: %s", CFG.headless)
+        self.logger.info("Parallel Browsers: %s", CFG.max_workers if self._parallel else 1)
         self.logger.info("=" * 80)
     
-    def _get_proxy_config(self, use_backup=False, backup_index=0):
+    @property
+    def current_doctor(self) -> Optional[str]:
+        """Doctor being processed by the calling thread."""
+        return getattr(self._local, 'doctor', None)
+    
+    @current_doctor.setter
+    def current_doctor(self, doctor_name: Optional[str]) -> None:
+        self._local.doctor = doctor_name
+    
+    def _count(self, metric: str) -> None:
+        """Increment a metric; safe to call from worker threads."""
+        with self._metrics_lock:
+            self.metrics[metric] += 1
+    
+    def _wait_for_provider_dropdown(self, page) -> None:
         """
-        Get proxy configuration if enabled.
+        Wait for the provider dropdown, the first dynamic element the scraper uses.
+        
+        A timeout is only logged; the title and 403 checks that follow decide
+        whether the page is usable.
         
         Args:
-            use_backup: Whether to use backup proxy list
-            backup_index: Index of backup proxy to use
+            page: Playwright page object
+        """
+        try:
+            page.wait_for_selector(SELECTORS.dropdown_any, timeout=15000)
+        except Exception as e:
+            self.logger.warning("Provider dropdown did not appear within timeout: %s", e)
+    
+    def _wait_for_state(self, page, selector: str, timeout: int, state: str = 'visible') -> bool:
+        """
+        Wait until a selector reaches a state instead of sleeping a fixed time.
+        
+        A timeout is not an error here; callers go on and let the next
+        locator call decide whether the page is usable.
         
+        Args:
+            page: Playwright page object
+            selector: Selector to wait for
+            timeout: Maximum wait in milliseconds
+            state: Playwright element state ('visible', 'attached', 'detached', 'hidden')
+            
         Returns:
-            Proxy configuration dict or None
+            True if the state was reached within the timeout
         """
-        if not Config.PROXY_ENABLED:
-            return None
-        
-        if use_backup and backup_index < len(Config.PROXY_BACKUP_LIST):
-            # Parse backup proxy (format: ip:port:username:password)
-            proxy_str = Config.PROXY_BACKUP_LIST[backup_index]
-            parts = proxy_str.split(':')
-            if len(parts) == 4:
-                ip, port, username, password = parts
-                self.logger.info(f"Using backup proxy {backup_index + 1}/{len(Config.PROXY_BACKUP_LIST)}: {ip}:{port}")
-                return {
-                    "server": f"http://{ip}:{port}",
-                    "username": username,
-                    "password": password
-                }
-        
-        # Use primary proxy
-        return {
-            "server": Config.PROXY_SERVER,
-            "username": Config.PROXY_USERNAME,
-            "password": Config.PROXY_PASSWORD
-        }
+        try:
+            page.wait_for_selector(selector, state=state, timeout=timeout)
+            return True
+        except Exception:
+            self.logger.debug("'%s' not %s after %d ms", selector, state, timeout)
+            return False
     
-    def _retry_with_backoff(self, func, *args, max_retries=None, **kwargs):
+    def _is_restricted(self, page, response) -> bool:
         """
-        Execute function with exponential backoff retry logic.
+        Detect a 403 or "restricted" block page.
         
         Args:
-            func: Function to execute
-            *args: Function arguments
-            max_retries: Maximum retry attempts
-            **kwargs: Function keyword arguments
+            page: Playwright page object
+            response: Main-document response from goto/reload, or None
             
         Returns:
-            Function result
-            
-        Raises:
-            Last exception if all retries fail
+            True if the site served a block page
         """
-        max_retries = max_retries or Config.MAX_RETRIES
-        last_exception = None
-        
-        for attempt in range(max_retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                self.metrics['retries'] += 1
-                
-                if attempt < max_retries - 1:
-                    delay = Config.RETRY_DELAY * (2 ** attempt)  # Exponential backoff
-                    self.logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}. "
-                        f"Retrying in {delay} seconds..."
-                    )
-                    time.sleep(delay)
-                else:
-                    self.logger.error(
-                        f"All {max_retries} attempts failed. Last error: {str(e)}"
-                    )
-        
-        raise last_exception
+        # The response status settles a hard 403 without touching the DOM
+        if response is not None and response.status == 403:
+            return True
+        return page.evaluate(_RESTRICTED_JS)
     
+    @retry_with_backoff(retry_on=(PageLoadError,))
     def _load_page(self, page, url: str) -> None:
         """
         Load page with retry logic and validation.
@@ -301,93 +871,96 @@ class ZocDocScraper:
             PageLoadError: If page load fails
         """
         try:
-            self.logger.info(f"Loading page: {url}")
-            page.goto(url, wait_until="networkidle", timeout=Config.PAGE_LOAD_TIMEOUT)
-            self.metrics['page_loads'] += 1
+            self.logger.info("Loading page: %s", url)
+            response = page.goto(url, wait_until="domcontentloaded", timeout=CFG.page_load_timeout)
+            self._count('page_loads')
             
-            # Wait for dynamic content
-            time.sleep(10)
+            # Wait for the provider dropdown to render rather than for network idle
+            self._wait_for_provider_dropdown(page)
             
             page_title = page.title()
-            self.logger.info(f"Page loaded successfully: {page_title}")
+            self.logger.info("Page loaded successfully: %s", page_title)
             
             # Validate page loaded correctly
             if "Dentistry At Its Finest" not in page_title:
                 raise PageLoadError(f"Unexpected page title: {page_title}")
             
             # Check for 403 or blocks
-            page_html = page.content()
-            if "403" in page_html and "restricted" in page_html.lower():
+            if self._is_restricted(page, response):
                 self.logger.warning("Detected 403 Restricted page, attempting reload...")
-                page.reload(wait_until="networkidle", timeout=Config.PAGE_LOAD_TIMEOUT)
-                time.sleep(5)
+                response = page.reload(wait_until="domcontentloaded", timeout=CFG.page_load_timeout)
+                self._wait_for_provider_dropdown(page)
                 
-                if "403" in page.content() and "restricted" in page.content().lower():
+                if self._is_restricted(page, response):
                     raise PageLoadError("Page still restricted after reload")
                 
                 self.logger.info("Page reloaded successfully")
+            
+            self._save_storage_state(page)
         
         except Exception as e:
-            self.logger.error(f"Page load failed: {str(e)}")
+            self.logger.error("Page load failed: %s", e)
             raise PageLoadError(f"Failed to load page: {str(e)}") from e
     
-    def _select_doctor(self, page, doctor_name: str) -> None:
+    # The dropdown can render after the page reports loaded, so selection gets
+    # the full delayed attempts; a switch that still fails is retried after a
+    # reload by _scrape_doctor
+    @retry_with_backoff(retry_on=(DoctorSelectionError,))
+    def _select_doctor(self, page, doctor: DoctorEntry) -> None:
         """
         Select target doctor from dropdown.
         
         Args:
             page: Playwright page object
-            doctor_name: Full doctor name to select (e.g., "Dr. Michael Ayzin, DDS")
+            doctor: Target doctor entry
             
         Raises:
             DoctorSelectionError: If doctor selection fails
         """
+        doctor_name = doctor.name
+        
         try:
-            self.logger.info(f"Searching for provider dropdown to select {doctor_name}...")
-            time.sleep(5)
-            
-            provider_dropdowns = page.locator(
-                '.css-nm0j11-control, '
-                '.css-eio9xs-control, '
-                'div[class*="control"]:has-text("provider"), '
-                'div[class*="control"]:has-text("All provider")'
-            )
+            self.logger.info("Searching for provider dropdown to select %s...", doctor_name)
+            
+            provider_dropdowns = page.locator(SELECTORS.dropdown_any)
             
-            dropdown_count = provider_dropdowns.count()
-            self.logger.debug(f"Found {dropdown_count} provider dropdowns")
+            # Snapshot every dropdown's text in one round-trip; nth() is only
+            # resolved for the dropdown that gets clicked
+            dropdown_texts = provider_dropdowns.all_inner_texts()
+            self.logger.debug("Found %d provider dropdowns", len(dropdown_texts))
             
-            if dropdown_count == 0:
+            if not dropdown_texts:
                 self.logger.error("No provider dropdowns found")
                 self._save_debug_artifacts(page, "no_dropdown")
                 raise DoctorSelectionError("No provider dropdowns found on page")
             
             doctor_selected = False
             
-            for i in range(dropdown_count):
+            for i, dropdown_text in enumerate(dropdown_texts):
                 try:
-                    dropdown = provider_dropdowns.nth(i)
-                    dropdown_text = dropdown.inner_text()
-                    self.logger.debug(f"Dropdown {i+1}: {dropdown_text[:80]}")
+                    self.logger.debug("Dropdown %d: %.80s", i + 1, dropdown_text)
                     
-                    if doctor_name.split(',')[0] in dropdown_text:
-                        self.logger.info(f"{doctor_name} already selected")
+                    if doctor.short_name in dropdown_text:
+                        self.logger.info("%s already selected", doctor_name)
                         doctor_selected = True
                         break
                     
-                    elif 'All provider' in dropdown_text or 'provider availability' in dropdown_text.lower():
-                        self.logger.info("Found 'All provider availability' dropdown")
+                    elif ('All provider' in dropdown_text or 'provider availability' in dropdown_text.lower()
+                          or any(entry.short_name in dropdown_text for entry in CFG.doctor_entries)):
+                        # Either the unfiltered view or another target doctor picked
+                        # on this page earlier; both switch from the same dropdown
+                        self.logger.info("Found provider dropdown showing: %s", dropdown_text[:80])
+                        dropdown = provider_dropdowns.nth(i)
                         dropdown.scroll_into_view_if_needed()
-                        time.sleep(1)
                         dropdown.click()
-                        time.sleep(3)
+                        self._wait_for_state(page, SELECTORS.provider_option_any, 5000)
                         
                         # Try multiple selection strategies
-                        ayzin_option = self._find_doctor_option(page, doctor_name)
+                        ayzin_option = self._find_doctor_option(page, doctor)
                         
                         if ayzin_option and ayzin_option.is_visible(timeout=2000):
-                            self.logger.info(f"Clicking {doctor_name} option...")
+                            self.logger.info("Clicking %s option...", doctor_name)
                             ayzin_option.scroll_into_view_if_needed()
-                            time.sleep(1)
                             
                             try:
                                 ayzin_option.click(timeout=3000)
@@ -395,16 +968,15 @@ class ZocDocScraper:
                                 self.logger.warning("Normal click failed, using force click")
                                 ayzin_option.click(force=True)
                             
-                            self.logger.info(f"Successfully selected {doctor_name}")
-                            time.sleep(4)
+                            self.logger.info("Successfully selected %s", doctor_name)
                             doctor_selected = True
                             break
                         else:
-                            self.logger.error(f"Could not find {doctor_name} in options")
+                            self.logger.error("Could not find %s in options", doctor_name)
                             self._save_debug_artifacts(page, "doctor_option_not_found")
                 
                 except Exception as e:
-                    self.logger.warning(f"Error with dropdown {i+1}: {str(e)}")
+                    self.logger.warning("Error with dropdown %s: %s", i + 1, e)
                     continue
             
             if not doctor_selected:
@@ -413,25 +985,25 @@ class ZocDocScraper:
         except DoctorSelectionError:
             raise
         except Exception as e:
-            self.logger.error(f"Doctor selection failed: {str(e)}")
+            self.logger.error("Doctor selection failed: %s", e)
             raise DoctorSelectionError(f"Failed to select doctor: {str(e)}") from e
     
-    def _find_doctor_option(self, page, doctor_name_full):
+    def _find_doctor_option(self, page, doctor: DoctorEntry):
         """
         Find doctor option using multiple strategies.
         
         Args:
             page: Playwright page object
-            doctor_name_full: Full doctor name (e.g., "Dr. Michael Ayzin, DDS")
+            doctor: Target doctor entry
             
         Returns:
             Doctor option locator or None
         """
-        doctor_name = doctor_name_full.split(',')[0]  # "Dr. Michael Ayzin"
+        doctor_name = doctor.short_name  # "Dr. Michael Ayzin"
         
         # Strategy 1: role="option" filter
         try:
-            option = page.locator('[role="option"]').filter(has_text=doctor_name).first
+            option = page.locator(SELECTORS.provider_option_role).filter(has_text=doctor_name).first
             if option.is_visible(timeout=2000):
                 self.logger.debug("Found via role='option' filter")
                 return option
@@ -440,18 +1012,21 @@ class ZocDocScraper:
         
         # Strategy 2: data-test="provider-option"
         try:
-            all_opts = page.locator('[data-test="provider-option"]')
-            for i in range(all_opts.count()):
-                opt = all_opts.nth(i)
-                if doctor_name in opt.inner_text():
-                    self.logger.debug("Found via data-test='provider-option'")
-                    return opt
+            # Match inside the page; only the index of the first hit comes back
+            all_opts = page.locator(SELECTORS.provider_option)
+            index = all_opts.evaluate_all(
+                "(nodes, name) => nodes.findIndex(n => n.innerText.includes(name))",
+                doctor_name
+            )
+            if index >= 0:
+                self.logger.debug("Found via data-test='provider-option'")
+                return all_opts.nth(index)
         except:
             pass
         
         # Strategy 3: div text search
         try:
-            option = page.locator(f'div:has-text("{doctor_name_full}")').first
+            option = page.locator(doctor.text_selector).first
             if option.is_visible(timeout=2000):
                 self.logger.debug("Found via div text search")
                 return option
@@ -475,51 +1050,128 @@ class ZocDocScraper:
             DataExtractionError: If extraction fails
         """
         try:
-            soup = BeautifulSoup(modal_html, 'html.parser')
-            timeslot_elements = soup.find_all('a', {'data-test': 'availability-modal-timeslot'})
+            timeslots = parse_timeslots(modal_html)
             
-            self.logger.info(f"Found {len(timeslot_elements)} appointment timeslots")
+            self.logger.info("Found %s appointment timeslots", len(timeslots))
             
-            if len(timeslot_elements) == 0:
+            if len(timeslots) == 0:
                 self.logger.warning("No timeslots found in modal")
                 self._save_html_artifact(modal_html, "empty_modal")
                 return []
             
+            doctor = sys.intern(self.current_doctor)
+            scraped_at = datetime.now().isoformat()
             appointments = []
             
-            for timeslot in timeslot_elements:
-                try:
-                    time_text = timeslot.get_text(strip=True)
-                    
-                    date_wrapper = timeslot.find_parent('div', {'data-test': 'availability-modal-content-date-wrapper'})
-                    if date_wrapper:
-                        date_title = date_wrapper.find('div', {'data-test': 'availability-modal-content-day-title'})
-                        date_text = date_title.get_text(strip=True) if date_title else "Unknown Date"
-                    else:
-                        date_text = "Unknown Date"
-                        self.logger.debug(f"No date wrapper for timeslot: {time_text}")
-                    
-                    appointment = {
-                        'doctor': self.current_doctor,
-                        'date': date_text,
-                        'time': time_text,
-                        'datetime': f"{date_text} {time_text}",
-                        'scraped_at': datetime.now().isoformat()
-                    }
-                    
-                    appointments.append(appointment)
-                    self.logger.debug(f"Extracted: {date_text} - {time_text}")
+            # Checked once: the per-slot debug lines are skipped entirely below DEBUG
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            
+            for day_title, time_text in timeslots:
+                if day_title:
+                    # Interned: every slot on the same day shares one string
+                    date_text = sys.intern(day_title)
+                else:
+                    date_text = "Unknown Date"
+                    if debug:
+                        self.logger.debug("No date wrapper for timeslot: %s", time_text)
                 
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract timeslot: {str(e)}")
-                    continue
+                appointments.append({
+                    'doctor': doctor,
+                    'date': date_text,
+                    'time': time_text,
+                    'datetime': f"{date_text} {time_text}",
+                    'scraped_at': scraped_at
+                })
+                if debug:
+                    self.logger.debug("Extracted: %s - %s", date_text, time_text)
             
             return appointments
         
         except Exception as e:
-            self.logger.error(f"Appointment extraction failed: {str(e)}")
+            self.logger.error("Appointment extraction failed: %s", e)
             raise DataExtractionError(f"Failed to extract appointments: {str(e)}") from e
     
+    def _extract_timeslots_bulk(self, page) -> List[Dict]:
+        """
+        Read all timeslots of the open modal with a single page.evaluate call.
+        
+        Args:
+            page: Playwright page object
+            
+        Returns:
+            List of appointment dictionaries
+            
+        Raises:
+            ModalNotFoundError: If neither the modal nor any timeslot is on the page
+        """
+        # Installed by _new_page; if it is missing the call throws and
+        # _extract_timeslots falls back to parsing the page HTML
+        slots = page.evaluate(_TIMESLOT_CALL_JS)
+        if slots is None:
+            raise ModalNotFoundError("Modal container not found in page")
+        
+        self.logger.info("Found %s appointment timeslots", len(slots))
+        
+        if not slots:
+            self.logger.warning("No timeslots found in modal")
+            self._save_html_artifact(page.content(), "empty_modal")
+            return []
+        
+        doctor = sys.intern(self.current_doctor)
+        scraped_at = datetime.now().isoformat()
+        return [{'doctor': doctor, **slot, 'scraped_at': scraped_at} for slot in slots]
+    
+    def _extract_timeslots_from_html(self, page) -> List[Dict]:
+        """
+        Extract timeslots by parsing the modal's HTML.
+        
+        Fallback for when the in-browser bulk read fails. Only the modal
+        subtree crosses the wire; the whole page is fetched only if timeslots
+        exist outside any recognised modal container.
+        
+        Args:
+            page: Playwright page object
+            
+        Returns:
+            List of appointment dictionaries
+            
+        Raises:
+            ModalNotFoundError: If neither the modal nor any timeslot is on the page
+        """
+        # Find modal container (view container or generic modal content)
+        modal_html = page.evaluate(_MODAL_HTML_JS, SELECTORS.modal_any)
+        
+        if modal_html is None:
+            self.logger.warning(
+                "Modal container not found (tried %s and %s)",
+                SELECTORS.modal_container, SELECTORS.modal_content
+            )
+            if page.locator(SELECTORS.timeslot).count() > 0:
+                self.logger.info("Timeslots found in page HTML, extracting directly")
+                modal_html = page.content()
+            else:
+                raise ModalNotFoundError("Modal container not found in page")
+        
+        return self._extract_appointments_from_modal(page, modal_html)
+    
+    def _extract_timeslots(self, page) -> List[Dict]:
+        """
+        Extract timeslots in one browser round-trip, parsing HTML only on failure.
+        
+        Args:
+            page: Playwright page object
+            
+        Returns:
+            List of appointment dictionaries
+        """
+        try:
+            return self._extract_timeslots_bulk(page)
+        except ModalNotFoundError:
+            raise
+        except Exception as e:
+            self.logger.warning("Bulk timeslot read failed, parsing page HTML: %s", e)
+            return self._extract_timeslots_from_html(page)
+    
     def _process_modal(self, page, button_index: int) -> List[Dict]:
         """
         Process a single modal and extract appointments.
@@ -532,103 +1184,79 @@ class ZocDocScraper:
             List of appointments from this modal
         """
         try:
-            self.logger.info(f"Processing modal {button_index + 1}")
+            self.logger.info("Processing modal %s", button_index + 1)
             
-            buttons = page.locator('span:has-text("View more availability")')
+            buttons = page.locator(SELECTORS.view_more)
             button = buttons.nth(button_index)
             
             button.scroll_into_view_if_needed()
-            time.sleep(1)
             button.click()
             self.logger.debug("Modal opened, waiting for content...")
             
-            # Wait for modal to appear first
-            time.sleep(2)
-            
             # Wait for timeslots to load - increased timeout for slower loads
             self.logger.info("Waiting for appointment timeslots to load...")
             try:
-                page.wait_for_selector('[data-test="availability-modal-timeslot"]', timeout=20000)
-                time.sleep(3)  # Extra time for all slots to render completely
+                page.wait_for_selector(SELECTORS.timeslot, timeout=20000)
                 self.logger.debug("Timeslots loaded successfully")
             except Exception as e:
-                self.logger.warning(f"Timeslots did not appear within timeout: {str(e)}")
-                # Wait a bit more before giving up
-                time.sleep(2)
-            
-            # Get modal HTML
-            page_html = page.content()
-            soup = BeautifulSoup(page_html, 'html.parser')
-            
-            # Find modal container
-            modal_container = soup.find('div', {'data-test': 'availability-modal-view-container'})
-            
-            if not modal_container:
-                self.logger.warning("Modal container not found, trying alternative")
-                modal_container = soup.find('div', {'data-test': 'modal-content'})
-            
-            if not modal_container:
-                if 'availability-modal-timeslot' in page_html:
-                    self.logger.info("Timeslots found in page HTML, extracting directly")
-                    modal_container = soup
-                else:
-                    raise ModalNotFoundError("Modal container not found in page")
+                self.logger.warning("Timeslots did not appear within timeout: %s", e)
             
             # Extract appointments
-            appointments = self._extract_appointments_from_modal(page, str(modal_container))
+            appointments = self._extract_timeslots(page)
             
             # Try to load more appointments
             try:
-                show_more_btn = page.locator('button:has-text("Show more availability")').first
+                show_more_btn = page.locator(SELECTORS.show_more).first
                 if show_more_btn.is_visible(timeout=2000):
                     self.logger.info("Loading more appointments...")
+                    slot_count = page.locator(SELECTORS.timeslot).count()
                     show_more_btn.click()
-                    time.sleep(5)
                     
-                    # Re-extract
-                    page_html = page.content()
-                    soup = BeautifulSoup(page_html, 'html.parser')
-                    modal_container = soup.find('div', {'data-test': 'availability-modal-view-container'})
+                    # Wait until the extra timeslots are in the DOM
+                    page.wait_for_function(
+                        "([sel, n]) => document.querySelectorAll(sel).length > n",
+                        arg=[SELECTORS.timeslot, slot_count],
+                        timeout=5000
+                    )
                     
-                    if modal_container:
-                        new_appointments = self._extract_appointments_from_modal(page, str(modal_container))
-                        
-                        # Deduplicate
-                        existing = {(apt['date'], apt['time']) for apt in appointments}
-                        new_count = 0
-                        
-                        for apt in new_appointments:
-                            if (apt['date'], apt['time']) not in existing:
-                                appointments.append(apt)
-                                new_count += 1
-                        
-                        self.logger.info(f"Added {new_count} new appointments after loading more")
+                    # Re-extract and keep only the slots the first read did not see,
+                    # so the raw file gets each modal slot once
+                    existing = {(apt['date'], apt['time']) for apt in appointments}
+                    new_appointments = [
+                        apt for apt in self._extract_timeslots(page)
+                        if (apt['date'], apt['time']) not in existing
+                    ]
+                    appointments.extend(new_appointments)
+                    
+                    self.logger.info("Added %s more appointments", len(new_appointments))
             except:
                 self.logger.debug("No 'Show more' button or already showing all")
             
             # Close modal
             try:
-                close_btn = page.locator('button[aria-label="Close"]').first
+                close_btn = page.locator(SELECTORS.close_btn).first
                 if close_btn.is_visible(timeout=2000):
                     close_btn.click()
                 else:
                     page.keyboard.press('Escape')
-                time.sleep(1)
             except:
                 page.keyboard.press('Escape')
-                time.sleep(1)
+            self._wait_for_state(page, SELECTORS.modal_any, 3000, state='detached')
             
             return appointments
         
         except Exception as e:
-            self.logger.error(f"Modal processing failed: {str(e)}")
-            self.metrics['errors'] += 1
+            self.logger.error("Modal processing failed: %s", e)
+            self._count('errors')
             return []
     
     def _save_debug_artifacts(self, page, prefix: str) -> None:
         """
         Save debug artifacts (screenshots and HTML).
         
+        Only the capture runs on the calling thread; the files are written by
+        the artifact writer so scraping continues while they hit the disk.
+        
         Args:
             page: Playwright page object
             prefix: Filename prefix
@@ -636,16 +1264,14 @@ class ZocDocScraper:
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
-            screenshot_path = Config.OUTPUT_DIR / f"{prefix}_{timestamp}.png"
-            page.screenshot(path=str(screenshot_path), full_page=True)
-            self.logger.info(f"Saved screenshot: {screenshot_path}")
-            
-            html_path = Config.OUTPUT_DIR / f"{prefix}_{timestamp}.html"
-            html_path.write_text(page.content(), encoding='utf-8')
-            self.logger.info(f"Saved HTML: {html_path}")
+            # A full-page capture of the long practice page takes seconds;
+            # the viewport is enough unless ZOCDOC_DEBUG_FULL_PAGE is set
+            screenshot = page.screenshot(full_page=CFG.debug_full_page)
+            self._queue_artifact(CFG.output_dir / f"{prefix}_{timestamp}.png", screenshot)
+            self._queue_artifact(CFG.output_dir / f"{prefix}_{timestamp}.html", page.content())
         
         except Exception as e:
-            self.logger.warning(f"Failed to save debug artifacts: {str(e)}")
+            self.logger.warning("Failed to save debug artifacts: %s", e)
     
     def _save_html_artifact(self, html_content: str, prefix: str) -> None:
         """
@@ -655,20 +1281,93 @@ class ZocDocScraper:
             html_content: HTML content to save
             prefix: Filename prefix
         """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._queue_artifact(CFG.output_dir / f"{prefix}_{timestamp}.html", html_content)
+    
+    def _queue_artifact(self, path: Path, payload) -> None:
+        """
+        Hand an artifact to the writer thread, or write it directly outside run().
+        
+        Args:
+            path: Destination file
+            payload: PNG bytes or HTML text
+        """
+        if self._artifact_thread is not None:
+            self._artifact_queue.put((path, payload))
+        else:
+            self._write_artifact(path, payload)
+    
+    def _write_artifact(self, path: Path, payload) -> None:
+        """
+        Write one artifact to disk; failures are logged, never raised.
+        
+        Args:
+            path: Destination file
+            payload: PNG bytes or HTML text
+        """
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            html_path = Config.OUTPUT_DIR / f"{prefix}_{timestamp}.html"
-            html_path.write_text(html_content, encoding='utf-8')
-            self.logger.debug(f"Saved HTML artifact: {html_path}")
+            if isinstance(payload, bytes):
+                path.write_bytes(payload)
+            else:
+                path.write_text(payload, encoding='utf-8')
+            self.logger.info("Saved debug artifact: %s", path)
         except Exception as e:
-            self.logger.warning(f"Failed to save HTML artifact: {str(e)}")
+            self.logger.warning("Failed to save debug artifact %s: %s", path, e)
+    
+    def _artifact_worker(self) -> None:
+        """Write queued artifacts until the None sentinel arrives."""
+        while True:
+            item = self._artifact_queue.get()
+            if item is None:
+                return
+            self._write_artifact(*item)
+    
+    def _start_artifact_writer(self) -> None:
+        """Start the background artifact writer for this run."""
+        self._artifact_thread = threading.Thread(
+            target=self._artifact_worker, name='zocdoc-artifacts', daemon=True
+        )
+        self._artifact_thread.start()
+    
+    def _stop_artifact_writer(self) -> None:
+        """Write every queued artifact, then stop the writer thread."""
+        if self._artifact_thread is None:
+            return
+        self._artifact_queue.put(None)
+        self._artifact_thread.join()
+        self._artifact_thread = None
+    
+    def _write_table(self, table: "pa.Table", stem: str) -> Path:
+        """
+        Write a results table in the configured output format.
+        
+        Parquet is written with zstd compression; CSV is kept for
+        ZOCDOC_OUTPUT_FORMAT=csv. Both are written straight from Arrow.
+        
+        Args:
+            table: Appointments table
+            stem: File name without extension
+            
+        Returns:
+            Path to the written file
+        """
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+        
+        if CFG.output_format == 'csv':
+            path = CFG.output_dir / f'{stem}.csv'
+            pacsv.write_csv(table, path)
+        else:
+            path = CFG.output_dir / f'{stem}.parquet'
+            pq.write_table(table, path, compression='zstd')
+        return path
     
     def _save_results(self) -> Tuple[Path, Path]:
         """
-        Save scraping results to CSV files.
+        Save scraping results as Parquet (default) or CSV files.
         
         Returns:
-            Tuple of (raw_csv_path, cleaned_csv_path)
+            Tuple of (raw_path, cleaned_path)
             
         Raises:
             DataExtractionError: If saving fails
@@ -677,24 +1376,26 @@ class ZocDocScraper:
             if not self.appointments:
                 raise DataExtractionError("No appointments to save")
             
-            df = pd.DataFrame(self.appointments)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Raw rows are already on disk; close the file so it is complete
+            self._raw_writer.close()
+            raw_path = self._raw_writer.path
+            self.logger.info("Saved raw data: %s (%s appointments)", raw_path, self._raw_writer.rows)
             
-            # Save raw data
-            raw_path = Config.OUTPUT_DIR / f'appointments_raw_{timestamp}.csv'
-            df.to_csv(raw_path, index=False)
-            self.logger.info(f"Saved raw data: {raw_path} ({len(df)} appointments)")
+            # Records are accumulated as plain dicts, already unique per (doctor,
+            # date, time), and converted to columns in one build
+            table = appointments_table(self.appointments)
             
-            # Save cleaned data
-            df_clean = df.drop_duplicates(subset=['date', 'time']).reset_index(drop=True)
-            clean_path = Config.OUTPUT_DIR / f'appointments_cleaned_{timestamp}.csv'
-            df_clean.to_csv(clean_path, index=False)
-            self.logger.info(f"Saved cleaned data: {clean_path} ({len(df_clean)} unique appointments)")
+            # Save cleaned data, dropping malformed rows
+            clean = table.filter(validate_appointments(table))
+            if clean.num_rows < table.num_rows:
+                self.logger.warning("Dropping %s malformed appointments from cleaned data", table.num_rows - clean.num_rows)
+            clean_path = self._write_table(clean, f'appointments_cleaned_{self._stamp}')
+            self.logger.info("Saved cleaned data: %s (%s unique appointments)", clean_path, clean.num_rows)
             
             return raw_path, clean_path
         
         except Exception as e:
-            self.logger.error(f"Failed to save results: {str(e)}")
+            self.logger.error("Failed to save results: %s", e)
             raise DataExtractionError(f"Failed to save results: {str(e)}") from e
     
     def _print_summary(self, duration: float) -> None:
@@ -707,13 +1408,237 @@ class ZocDocScraper:
         self.logger.info("=" * 80)
         self.logger.info("EXECUTION SUMMARY")
         self.logger.info("=" * 80)
-        self.logger.info(f"Execution Time: {duration:.2f} seconds")
-        self.logger.info(f"Appointments Found: {self.metrics['appointments_found']}")
-        self.logger.info(f"Page Loads: {self.metrics['page_loads']}")
-        self.logger.info(f"Retries: {self.metrics['retries']}")
-        self.logger.info(f"Errors: {self.metrics['errors']}")
+        self.logger.info("Execution Time: %.2f seconds", duration)
+        self.logger.info("Appointments Found: %s", self.metrics['appointments_found'])
+        self.logger.info("Page Loads: %s", self.metrics['page_loads'])
+        self.logger.info("Retries: %s", self.metrics['retries'])
+        self.logger.info("Errors: %s", self.metrics['errors'])
         self.logger.info("=" * 80)
     
+    def _storage_state_path(self) -> Optional[str]:
+        """
+        Saved cookies and local storage from a recent run, if still fresh.
+        
+        Returns:
+            Path for new_context(storage_state=...), or None to start clean
+        """
+        path = STORAGE_STATE_PATH
+        if CFG.storage_state_ttl <= 0 or not path.exists():
+            return None
+        age = time.time() - path.stat().st_mtime
+        if age > CFG.storage_state_ttl:
+            self.logger.info("Ignoring stale storage state (%.0fs old)", age)
+            return None
+        self.logger.info("Reusing storage state: %s", path)
+        return str(path)
+    
+    def _save_storage_state(self, page) -> None:
+        """
+        Snapshot the context's cookies and local storage after the first good page load.
+        
+        Args:
+            page: Playwright page that passed the load checks
+        """
+        if CFG.storage_state_ttl <= 0:
+            return
+        with self._state_lock:
+            if self._state_saved:
+                return
+            self._state_saved = True
+        try:
+            page.context.storage_state(path=str(STORAGE_STATE_PATH))
+            self.logger.debug("Saved storage state: %s", STORAGE_STATE_PATH)
+        except Exception as e:
+            self.logger.warning("Failed to save storage state: %s", e)
+    
+    def _new_page(self, target):
+        """
+        Open a page with the timeslot extractor preinstalled, blocking heavy
+        resources when CFG.block_resources is set.
+        
+        Args:
+            target: Browser context
+            
+        Returns:
+            Playwright page object
+        """
+        page = target.new_page()
+        page.add_init_script(_TIMESLOT_INIT_JS)
+        if CFG.block_resources:
+            page.route("**/*", _block_heavy_resources)
+        return page
+    
+    def _browser_options(self, proxy: Optional[Dict]) -> Dict:
+        """
+        Build Camoufox launch options.
+        
+        Args:
+            proxy: Proxy configuration dict or None
+            
+        Returns:
+            Keyword arguments for Camoufox
+        """
+        return {
+            'headless': CFG.headless,
+            'proxy': proxy,
+            'humanize': CFG.humanize,
+            'geoip': False  # Disabled - requires: pip install camoufox[geoip]
+        }
+    
+    def _scrape_doctor(self, page, doctor_index: int, doctor: DoctorEntry, load_page: bool = True) -> List[Dict]:
+        """
+        Select one doctor on the practice page and collect their appointments.
+        
+        Args:
+            page: Playwright page object
+            doctor_index: Position of the doctor in CFG.doctor_entries
+            doctor: Target doctor entry
+            load_page: Navigate to CFG.target_url first; False switches doctors
+                on the already loaded page and reloads only if that fails
+            
+        Returns:
+            List of appointments for this doctor
+        """
+        doctor_name = doctor.name
+        self.current_doctor = doctor_name
+        self.logger.info("\n%s", '=' * 80)
+        self.logger.info("Processing doctor %s/%s: %s", doctor_index + 1, len(CFG.doctor_entries), doctor_name)
+        self.logger.info("%s", '=' * 80)
+        
+        # Load page with retry
+        if load_page:
+            self._load_page(page, CFG.target_url)
+        
+        # Select doctor with retry. On a page left over from the previous doctor
+        # a failed switch is recovered with one fresh load; a doctor that still
+        # cannot be selected is skipped without relaunching the browser.
+        try:
+            self._select_doctor(page, doctor)
+        except DoctorSelectionError as e:
+            if load_page:
+                self.logger.error("Skipping %s: %s", doctor_name, e)
+                return []
+            
+            self.logger.warning("In-page switch to %s failed, reloading: %s", doctor_name, e)
+            return self._scrape_doctor(page, doctor_index, doctor, load_page=True)
+        
+        self.logger.info("Waiting for page to update after doctor selection...")
+        self._wait_for_state(page, SELECTORS.view_more, 8000)
+        
+        # Find modal buttons
+        view_more_buttons = page.locator(SELECTORS.view_more)
+        button_count = view_more_buttons.count()
+        
+        if button_count == 0:
+            self.logger.warning("No 'View more availability' buttons found for %s", doctor_name)
+            self._save_debug_artifacts(page, f"no_buttons_{doctor.key}")
+            # Continue to next doctor instead of failing completely
+            return []
+        
+        self.logger.info("Found %s 'View more availability' buttons for %s", button_count, doctor_name)
+        
+        # Process each modal
+        appointments = []
+        for idx in range(button_count):
+            if SHUTDOWN.is_set():
+                self.logger.warning("Shutdown requested, stopping after %s of %s modals", idx, button_count)
+                break
+            try:
+                appointments.extend(self._process_modal(page, idx))
+            except Exception as e:
+                self.logger.error("Failed to process modal %s for %s: %s", idx + 1, doctor_name, e)
+                continue
+        
+        self.logger.info("Collected %s appointments for %s", len(appointments), doctor_name)
+        return appointments
+    
+    def _scrape_doctor_in_own_browser(self, doctor_index: int, doctor: DoctorEntry, proxy: Optional[Dict]) -> List[Dict]:
+        """
+        Scrape one doctor in a dedicated browser; runs on a worker thread.
+        
+        Args:
+            doctor_index: Position of the doctor in CFG.doctor_entries
+            doctor: Target doctor entry
+            proxy: Proxy configuration dict or None
+            
+        Returns:
+            List of appointments for this doctor
+        """
+        from camoufox.sync_api import Camoufox
+        
+        with Camoufox(**self._browser_options(proxy)) as browser:
+            page = self._new_page(browser.new_context(storage_state=self._storage_state_path()))
+            try:
+                return self._scrape_doctor(page, doctor_index, doctor)
+            except (PageLoadError, ProxyConnectionError):
+                raise
+            except Exception:
+                self._save_debug_artifacts(page, f"error_doctor_{doctor_index + 1}")
+                raise
+    
+    def _add_appointments(self, appointments: List[Dict]) -> None:
+        """
+        Stream a batch to the raw file, then keep appointments not collected
+        yet, keyed by (doctor, date, time).
+        
+        Args:
+            appointments: Appointments from one doctor
+        """
+        self._raw_writer.write(appointments)
+        
+        seen = self._seen
+        for apt in appointments:
+            key = (apt['doctor'], apt['date'], apt['time'])
+            if key not in seen:
+                seen.add(key)
+                self.appointments.append(apt)
+    
+    def _collect(self, page, proxy_label: str, proxy: Optional[Dict]) -> None:
+        """
+        Collect appointments for every target doctor into self.appointments.
+        
+        Doctors are scraped one after another on the shared page, or concurrently
+        in separate browsers when CFG.max_workers allows it. Parallel browsers
+        after the first use the proxies following this attempt's proxy in the
+        pool, so each doctor is fetched from a different exit IP while the
+        failover rotation in run() still visits every proxy.
+        
+        Args:
+            page: Shared Playwright page, or None in parallel mode
+            proxy_label: Label of this attempt's proxy
+            proxy: Proxy configuration dict for this attempt, or None
+        """
+        doctors = CFG.doctor_entries
+        
+        if not self._parallel:
+            for doctor_index, doctor in enumerate(doctors):
+                if SHUTDOWN.is_set():
+                    self.logger.warning("Shutdown requested, skipping %s remaining doctors", len(doctors) - doctor_index)
+                    break
+                # The practice page is a single-page app: it is loaded for the
+                # first doctor only, later doctors switch through the dropdown
+                self._add_appointments(self._scrape_doctor(page, doctor_index, doctor, load_page=doctor_index == 0))
+            return
+        
+        workers = min(CFG.max_workers, len(doctors))
+        self.logger.info("Scraping %s doctors with %s parallel browsers", len(doctors), workers)
+        
+        proxies = [proxy] + worker_proxies(proxy_label, len(doctors) - 1)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='zocdoc-doctor') as pool:
+            futures = [
+                pool.submit(self._scrape_doctor_in_own_browser, doctor_index, doctor, doctor_proxy)
+                for doctor_index, (doctor, doctor_proxy) in enumerate(zip(doctors, proxies))
+            ]
+            # Results are gathered in doctor order; the first failure propagates.
+            # On shutdown, doctors not started yet are dropped and running ones
+            # stop at their next modal
+            for doctor, future in zip(doctors, futures):
+                if SHUTDOWN.is_set() and future.cancel():
+                    self.logger.warning("Shutdown requested, %s not started", doctor.name)
+                    continue
+                self._add_appointments(future.result())
+    
     def run(self) -> Dict:
         """
         Execute scraping workflow with proxy rotation on failure.
@@ -724,75 +1649,37 @@ class ZocDocScraper:
         Raises:
             ZocDocScraperError: If scraping fails with all proxies
         """
+        from camoufox.sync_api import Camoufox
+        
         self.start_time = time.time()
         last_error = None
+        self._start_artifact_writer()
         
-        # Try primary proxy first, then backup proxies
-        max_proxy_attempts = 1 + len(Config.PROXY_BACKUP_LIST) if Config.PROXY_ENABLED else 1
+        # Each attempt takes the next proxy in the rotation, starting from the
+        # primary, so a failing run tries every configured proxy once
+        reset_proxy_rotation()
+        max_proxy_attempts = max(1, len(PROXY_POOL))
         
-        for proxy_attempt in range(max_proxy_attempts):
-            try:
-                # Get proxy config (primary or backup)
-                use_backup = proxy_attempt > 0
-                backup_index = proxy_attempt - 1 if use_backup else 0
-                proxy = self._get_proxy_config(use_backup=use_backup, backup_index=backup_index)
-                
-                if proxy_attempt == 0:
-                    self.logger.info("Launching browser with primary proxy...")
-                
-                with Camoufox(
-                    headless=Config.HEADLESS,
-                    proxy=proxy,
-                    humanize=Config.HUMANIZE,
-                    geoip=False  # Disabled - requires: pip install camoufox[geoip]
-                ) as browser:
-                    page = browser.new_page()
+        # Sequential runs launch one browser for every attempt and switch proxies
+        # per browser context; parallel runs give every doctor its own browser
+        browser_cm = nullcontext() if self._parallel else Camoufox(**self._browser_options(None))
+        
+        try:
+            with browser_cm as browser:
+                for proxy_attempt in range(max_proxy_attempts):
+                    proxy_label, proxy = next_proxy()
+                    
+                    if proxy is not None:
+                        self.logger.info("Using %s proxy: %s", proxy_label, proxy['server'])
+                    
+                    context = (
+                        browser.new_context(proxy=proxy, storage_state=self._storage_state_path())
+                        if browser is not None else None
+                    )
+                    page = self._new_page(context) if context is not None else None
                     
                     try:
-                        # Process each doctor sequentially
-                        for doctor_index, doctor_name in enumerate(Config.TARGET_DOCTORS):
-                            self.current_doctor = doctor_name
-                            self.logger.info(f"\n{'='*80}")
-                            self.logger.info(f"Processing doctor {doctor_index + 1}/{len(Config.TARGET_DOCTORS)}: {doctor_name}")
-                            self.logger.info(f"{'='*80}")
-                            
-                            # Load page with retry
-                            self._retry_with_backoff(self._load_page, page, Config.TARGET_URL)
-                            
-                            # Select doctor with retry
-                            self._retry_with_backoff(self._select_doctor, page, doctor_name)
-                            
-                            self.logger.info("Waiting for page to update after doctor selection...")
-                            time.sleep(5)  # Increased wait time for page to fully update
-                            
-                            # Find modal buttons
-                            view_more_buttons = page.locator('span:has-text("View more availability")')
-                            button_count = view_more_buttons.count()
-                            
-                            if button_count == 0:
-                                self.logger.warning(f"No 'View more availability' buttons found for {doctor_name}")
-                                self._save_debug_artifacts(page, f"no_buttons_{doctor_name.replace(' ', '_').replace(',', '')}")
-                                # Continue to next doctor instead of failing completely
-                                continue
-                            
-                            self.logger.info(f"Found {button_count} 'View more availability' buttons for {doctor_name}")
-                            
-                            # Process each modal
-                            for idx in range(button_count):
-                                try:
-                                    appointments = self._process_modal(page, idx)
-                                    self.appointments.extend(appointments)
-                                except Exception as e:
-                                    self.logger.error(f"Failed to process modal {idx + 1} for {doctor_name}: {str(e)}")
-                                    continue
-                            
-                            self.logger.info(f"Collected {len([a for a in self.appointments if a['doctor'] == doctor_name])} appointments for {doctor_name}")
-                            
-                            # Navigate to URL again for next doctor (except for the last one)
-                            # Using goto instead of reload is more reliable
-                            if doctor_index < len(Config.TARGET_DOCTORS) - 1:
-                                self.logger.info(f"Loading page for next doctor...")
-                                time.sleep(3)  # Give page time to settle before navigating
+                        self._collect(page, proxy_label, proxy)
                         
                         self.metrics['appointments_found'] = len(self.appointments)
                         
@@ -807,47 +1694,61 @@ class ZocDocScraper:
                         
                         return {
                             'success': True,
-                            'appointments_count': len(self.appointments),
-                            'unique_count': len(set((apt['date'], apt['time']) for apt in self.appointments)),
+                            'appointments_count': self._raw_writer.rows,
+                            'unique_count': len(self._seen),
                             'raw_file': str(raw_path),
                             'cleaned_file': str(clean_path),
                             'duration': duration,
                             'metrics': self.metrics,
-                            'proxy_used': f"backup_{backup_index + 1}" if use_backup else "primary"
+                            'proxy_used': proxy_label
                         }
                     
                     except (PageLoadError, ProxyConnectionError) as e:
-                        # Connection errors - try next proxy
+                        # Connection errors - try next proxy in a fresh context
                         last_error = e
-                        self.logger.warning(f"Proxy attempt {proxy_attempt + 1} failed: {str(e)}")
-                        if proxy_attempt < max_proxy_attempts - 1:
+                        self.logger.warning("Proxy attempt %s failed: %s", proxy_attempt + 1, e)
+                        if proxy_attempt < max_proxy_attempts - 1 and not SHUTDOWN.is_set():
                             self.logger.info("Trying next proxy...")
                             continue
                         else:
-                            self.logger.error(f"All {max_proxy_attempts} proxy attempts failed")
+                            self.logger.error("All %s proxy attempts failed", max_proxy_attempts)
                             raise
-            
+                    
                     except Exception as e:
                         # Other errors - save debug and fail immediately
-                        self.logger.error(f"Scraping error: {str(e)}")
-                        try:
-                            self._save_debug_artifacts(page, "error")
-                        except:
-                            pass
+                        self.logger.error("Scraping error: %s", e)
+                        if page is not None:
+                            try:
+                                self._save_debug_artifacts(page, "error")
+                            except:
+                                pass
                         raise
-
-            except Exception as final_error:
-                duration = time.time() - self.start_time if self.start_time else 0
-                self.logger.error(f"Fatal error: {str(final_error)}")
-                self.logger.error(traceback.format_exc())
-                
-                return {
-                    'success': False,
-                    'error': str(final_error),
-                    'error_type': type(final_error).__name__,
-                    'duration': duration,
-                    'metrics': self.metrics
-                }
+                    
+                    finally:
+                        # Only the context is discarded; the browser process stays up
+                        if context is not None:
+                            try:
+                                context.close()
+                            except Exception:
+                                pass
+        
+        except Exception as final_error:
+            duration = time.time() - self.start_time if self.start_time else 0
+            self.logger.exception("Fatal error: %s", final_error)
+            
+            return {
+                'success': False,
+                'error': str(final_error),
+                'error_type': type(final_error).__name__,
+                'duration': duration,
+                'metrics': self.metrics
+            }
+        
+        finally:
+            # Keep whatever was streamed before a failure readable, and let
+            # pending debug artifacts reach the disk before returning
+            self._raw_writer.close()
+            self._stop_artifact_writer()
   
 
 
@@ -856,16 +1757,51 @@ class ZocDocScraper:
 # MAIN EXECUTION
 # ============================================================================
 
+# Number of the signal that requested shutdown, logged by main once the run stops
+_shutdown_signal: Optional[int] = None
+
+
 def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    logger = logging.getLogger('zocdoc_scraper')
-    logger.warning(f"Received signal {signum}, shutting down gracefully...")
-    sys.exit(0)
+    """
+    Record a shutdown signal.
+    
+    SHUTDOWN itself is set by _watch_signals, woken through the signal wakeup
+    fd, so this handler touches no locks: not the logging locks and not the
+    Event's condition, either of which the interrupted main thread may hold.
+    """
+    global _shutdown_signal
+    _shutdown_signal = signum
+
+
+def _watch_signals(wakeup_fd: int) -> None:
+    """
+    Set SHUTDOWN as soon as a signal number is written to the wakeup fd.
+    
+    The interpreter writes the byte from its C-level handler, so this wakes
+    even while the main thread is blocked inside a browser call and has not
+    run the Python handler yet.
+    
+    Args:
+        wakeup_fd: Read end of the pipe passed to signal.set_wakeup_fd
+    """
+    global _shutdown_signal
+    while True:
+        data = os.read(wakeup_fd, 512)
+        if not data:  # Write end closed by main
+            return
+        _shutdown_signal = data[-1]
+        SHUTDOWN.set()
 
 
 def main():
     """Main entry point with comprehensive error handling."""
-    # Setup signal handlers
+    # Setup signal handlers; the wakeup pipe makes a signal visible to every
+    # thread immediately instead of at the main thread's next bytecode
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_write, False)
+    signal.set_wakeup_fd(wakeup_write)
+    watcher = threading.Thread(target=_watch_signals, args=(wakeup_read,), name='zocdoc-signals', daemon=True)
+    watcher.start()
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
@@ -875,11 +1811,15 @@ def main():
         scraper = ZocDocScraper(logger)
         result = scraper.run()
         
+        if SHUTDOWN.is_set():
+            logger.warning("Shut down by signal %s", _shutdown_signal)
+            sys.exit(130)
+        
         if result['success']:
             logger.info("✅ Scraping completed successfully")
             sys.exit(0)
         else:
-            logger.error(f"❌ Scraping failed: {result.get('error')}")
+            logger.error("❌ Scraping failed: %s", result.get('error'))
             sys.exit(1)
     
     except KeyboardInterrupt:
@@ -887,9 +1827,14 @@ def main():
         sys.exit(130)
     
     except Exception as e:
-        logger.critical(f"Unhandled exception: {str(e)}")
-        logger.critical(traceback.format_exc())
+        logger.critical("Unhandled exception: %s", e, exc_info=True)
         sys.exit(1)
+    
+    finally:
+        signal.set_wakeup_fd(-1)
+        os.close(wakeup_write)
+        watcher.join()
+        os.close(wakeup_read)
 
 
 if __name__ == "__main__":